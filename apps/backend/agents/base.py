@@ -12,4 +12,5 @@ logger = logging.getLogger(__name__)
 
 # Configuration constants
 AUTO_CONTINUE_DELAY_SECONDS = 3
+SESSION_DELAY_SECONDS = 1  # Pause before starting the next session
 HUMAN_INTERVENTION_FILE = "PAUSE"
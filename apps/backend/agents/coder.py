@@ -56,7 +56,11 @@ from ui import (
     print_status,
 )
 
-from .base import AUTO_CONTINUE_DELAY_SECONDS, HUMAN_INTERVENTION_FILE
+from .base import (
+    AUTO_CONTINUE_DELAY_SECONDS,
+    HUMAN_INTERVENTION_FILE,
+    SESSION_DELAY_SECONDS,
+)
 from .memory_manager import debug_memory_system_status, get_graphiti_context
 from .session import post_session_processing, run_agent_session
 from .utils import (
@@ -535,7 +539,7 @@ async def run_autonomous_agent(
         # Small delay between sessions
         if max_iterations is None or iteration < max_iterations:
             print("\nPreparing next session...\n")
-            await asyncio.sleep(1)
+            await asyncio.sleep(SESSION_DELAY_SECONDS)
 
     # Final summary
     content = [
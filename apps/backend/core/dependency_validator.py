@@ -19,6 +19,8 @@ def validate_platform_dependencies() -> None:
     """
     # Check Windows-specific dependencies
     if sys.platform == "win32" and sys.version_info >= (3, 12):
+        # Import rather than just locate: pywintypes can be found on disk and
+        # still fail to load when the pywin32 DLLs are missing.
         try:
             import pywintypes  # noqa: F401
         except ImportError:
@@ -1963,7 +1963,7 @@ async def _attempt_ai_merge(
 
 async def _merge_file_with_ai_async(
     task: ParallelMergeTask,
-    semaphore: asyncio.Semaphore,
+    semaphore: asyncio.BoundedSemaphore,
 ) -> ParallelMergeResult:
     """
     Merge a single file using AI.
@@ -1975,24 +1975,25 @@ async def _merge_file_with_ai_async(
     Returns:
         ParallelMergeResult with merged content or error
     """
-    async with semaphore:
-        try:
-            # First try simple 3-way merge
-            success, merged = _try_simple_3way_merge(
-                task.base_content,
-                task.main_content,
-                task.worktree_content,
-            )
+    try:
+        # First try simple 3-way merge. It is cheap and local, so it runs
+        # before taking a slot; only files that need AI wait on the semaphore.
+        success, merged = _try_simple_3way_merge(
+            task.base_content,
+            task.main_content,
+            task.worktree_content,
+        )
 
-            if success and merged is not None:
-                debug(MODULE, f"Auto-merged {task.file_path} without AI")
-                return ParallelMergeResult(
-                    file_path=task.file_path,
-                    merged_content=merged,
-                    success=True,
-                    was_auto_merged=True,
-                )
+        if success and merged is not None:
+            debug(MODULE, f"Auto-merged {task.file_path} without AI")
+            return ParallelMergeResult(
+                file_path=task.file_path,
+                merged_content=merged,
+                success=True,
+                was_auto_merged=True,
+            )
 
+        async with semaphore:
             # Need AI merge
             debug(MODULE, f"Using AI to merge {task.file_path}")
 
@@ -2073,14 +2074,14 @@ async def _merge_file_with_ai_async(
                     error=f"AI merge failed: {error}",
                 )
 
-        except Exception as e:
-            _merge_logger.error(f"Failed to merge {task.file_path}: {e}")
-            return ParallelMergeResult(
-                file_path=task.file_path,
-                merged_content=None,
-                success=False,
-                error=str(e),
-            )
+    except Exception as e:
+        _merge_logger.error(f"Failed to merge {task.file_path}: {e}")
+        return ParallelMergeResult(
+            file_path=task.file_path,
+            merged_content=None,
+            success=False,
+            error=str(e),
+        )
 
 
 async def _run_parallel_merges(
@@ -2107,8 +2108,9 @@ async def _run_parallel_merges(
         f"Starting parallel merge of {len(tasks)} files (max concurrent: {max_concurrent})",
     )
 
-    # Create semaphore for concurrency control
-    semaphore = asyncio.Semaphore(max_concurrent)
+    # Create semaphore for concurrency control (bounded so a stray extra
+    # release raises instead of silently raising the limit)
+    semaphore = asyncio.BoundedSemaphore(max_concurrent)
 
     # Create tasks
     merge_coroutines = [_merge_file_with_ai_async(task, semaphore) for task in tasks]
@@ -18,6 +18,12 @@ if TYPE_CHECKING:
     from ..types import SemanticChange
 
 
+def estimate_tokens(text: str) -> int:
+    """Rough estimate of tokens in rendered prompt text."""
+    # Rough estimate: 4 chars per token for code
+    return len(text) // 4
+
+
 @dataclass
 class ConflictContext:
     """
@@ -74,6 +80,4 @@ class ConflictContext:
     @property
     def estimated_tokens(self) -> int:
         """Rough estimate of tokens in this context."""
-        text = self.to_prompt_context()
-        # Rough estimate: 4 chars per token for code
-        return len(text) // 4
+        return estimate_tokens(self.to_prompt_context())
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable
+from dataclasses import dataclass
 
 from ..types import (
     ConflictRegion,
@@ -21,7 +22,7 @@ from ..types import (
     MergeStrategy,
     TaskSnapshot,
 )
-from .context import ConflictContext
+from .context import ConflictContext, estimate_tokens
 from .language_utils import infer_language, locations_overlap
 from .parsers import extract_batch_code_blocks, extract_code_block
 from .prompts import (
@@ -35,6 +36,26 @@ logger = logging.getLogger(__name__)
 # Type for the AI call function
 AICallFunction = Callable[[str, str], str]
 
+# Conflicts routed to AI: explicitly AI-required (or unclassified) and of
+# a severity worth a model call
+_AI_STRATEGIES = frozenset({MergeStrategy.AI_REQUIRED, None})
+_AI_SEVERITIES = frozenset({ConflictSeverity.MEDIUM, ConflictSeverity.HIGH})
+
+
+@dataclass(slots=True)
+class ResolverStats:
+    """Running AI usage counters for one resolver."""
+
+    calls_made: int = 0
+    estimated_tokens_used: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert to dictionary for serialization."""
+        return {
+            "calls_made": self.calls_made,
+            "estimated_tokens_used": self.estimated_tokens_used,
+        }
+
 
 class AIResolver:
     """
@@ -69,8 +90,7 @@ class AIResolver:
         """
         self.ai_call_fn = ai_call_fn
         self.max_context_tokens = max_context_tokens
-        self._call_count = 0
-        self._total_tokens = 0
+        self._stats = ResolverStats()
 
     def set_ai_function(self, ai_call_fn: AICallFunction) -> None:
         """Set the AI call function after initialization."""
@@ -79,15 +99,11 @@ class AIResolver:
     @property
     def stats(self) -> dict[str, int]:
         """Get usage statistics."""
-        return {
-            "calls_made": self._call_count,
-            "estimated_tokens_used": self._total_tokens,
-        }
+        return self._stats.to_dict()
 
     def reset_stats(self) -> None:
         """Reset usage statistics."""
-        self._call_count = 0
-        self._total_tokens = 0
+        self._stats = ResolverStats()
 
     def build_context(
         self,
@@ -108,16 +124,17 @@ class AIResolver:
         """
         # Filter to only changes at the conflict location
         task_changes: list[tuple[str, str, list]] = []
+        involved = set(conflict.tasks_involved)
+        location = conflict.location
 
         for snapshot in task_snapshots:
-            if snapshot.task_id not in conflict.tasks_involved:
+            if snapshot.task_id not in involved:
                 continue
 
             relevant_changes = [
                 c
                 for c in snapshot.semantic_changes
-                if c.location == conflict.location
-                or locations_overlap(c.location, conflict.location)
+                if c.location == location or locations_overlap(c.location, location)
             ]
 
             if relevant_changes:
@@ -178,29 +195,32 @@ class AIResolver:
         # Build context
         context = self.build_context(conflict, baseline_code, task_snapshots)
 
+        # Render once; the token estimate and the prompt both use it
+        prompt_context = context.to_prompt_context()
+        context_tokens = estimate_tokens(prompt_context)
+
         # Check token limit
-        if context.estimated_tokens > self.max_context_tokens:
+        if context_tokens > self.max_context_tokens:
             logger.warning(
-                f"Context too large ({context.estimated_tokens} tokens), "
+                f"Context too large ({context_tokens} tokens), "
                 "flagging for human review"
             )
             return MergeResult(
                 decision=MergeDecision.NEEDS_HUMAN_REVIEW,
                 file_path=conflict.file_path,
-                explanation=f"Context too large for AI ({context.estimated_tokens} tokens)",
+                explanation=f"Context too large for AI ({context_tokens} tokens)",
                 conflicts_remaining=[conflict],
             )
 
         # Build prompt
-        prompt_context = context.to_prompt_context()
         prompt = format_merge_prompt(prompt_context, context.language)
 
         # Call AI
         try:
             logger.info(f"Calling AI to resolve conflict in {conflict.file_path}")
             response = self.ai_call_fn(SYSTEM_PROMPT, prompt)
-            self._call_count += 1
-            self._total_tokens += context.estimated_tokens + len(response) // 4
+            self._stats.calls_made += 1
+            self._stats.estimated_tokens_used += context_tokens + len(response) // 4
 
             # Parse response
             merged_code = extract_code_block(response, context.language)
@@ -212,7 +232,7 @@ class AIResolver:
                     merged_content=merged_code,
                     conflicts_resolved=[conflict],
                     ai_calls_made=1,
-                    tokens_used=context.estimated_tokens,
+                    tokens_used=context_tokens,
                     explanation=f"AI resolved conflict at {conflict.location}",
                 )
             else:
@@ -223,7 +243,7 @@ class AIResolver:
                     explanation="Could not parse AI merge response",
                     conflicts_remaining=[conflict],
                     ai_calls_made=1,
-                    tokens_used=context.estimated_tokens,
+                    tokens_used=context_tokens,
                 )
 
         except Exception as e:
@@ -317,7 +337,8 @@ class AIResolver:
             all_contexts.append(ctx)
 
         # Check combined token limit
-        total_tokens = sum(ctx.estimated_tokens for ctx in all_contexts)
+        prompt_contexts = [ctx.to_prompt_context() for ctx in all_contexts]
+        total_tokens = sum(estimate_tokens(text) for text in prompt_contexts)
         if total_tokens > self.max_context_tokens:
             # Too big to batch, fall back to individual resolution
             results = []
@@ -337,9 +358,7 @@ class AIResolver:
             return merged
 
         # Build combined prompt
-        combined_context = "\n\n---\n\n".join(
-            ctx.to_prompt_context() for ctx in all_contexts
-        )
+        combined_context = "\n\n---\n\n".join(prompt_contexts)
 
         language = all_contexts[0].language if all_contexts else "text"
 
@@ -352,8 +371,8 @@ class AIResolver:
 
         try:
             response = self.ai_call_fn(SYSTEM_PROMPT, batch_prompt)
-            self._call_count += 1
-            self._total_tokens += total_tokens + len(response) // 4
+            self._stats.calls_made += 1
+            self._stats.estimated_tokens_used += total_tokens + len(response) // 4
 
             # Parse batch response
             # This is a simplified parser - production would be more robust
@@ -411,7 +430,7 @@ class AIResolver:
         Only handles conflicts that need AI resolution.
         """
         return (
-            conflict.merge_strategy in {MergeStrategy.AI_REQUIRED, None}
-            and conflict.severity in {ConflictSeverity.MEDIUM, ConflictSeverity.HIGH}
+            conflict.merge_strategy in _AI_STRATEGIES
+            and conflict.severity in _AI_SEVERITIES
             and self.ai_call_fn is not None
         )
@@ -46,8 +46,7 @@ class AppendFunctionsStrategy(MergeStrategyHandler):
             content = "\n".join(lines)
         else:
             # Just append at the end
-            for func in new_functions:
-                content += f"\n\n{func}"
+            content = "\n\n".join([content, *new_functions])
 
         return MergeResult(
             decision=MergeDecision.AUTO_MERGED,
@@ -111,8 +110,7 @@ class AppendStatementsStrategy(MergeStrategyHandler):
                     additions.append(change.content_after)
 
         # Append at appropriate location
-        for addition in additions:
-            content += f"\n{addition}"
+        content = "\n".join([content, *additions])
 
         return MergeResult(
             decision=MergeDecision.AUTO_MERGED,
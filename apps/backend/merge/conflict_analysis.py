@@ -44,6 +44,25 @@ except ImportError:
 logger = logging.getLogger(__name__)
 MODULE = "merge.conflict_analysis"
 
+# Change types that rewrite core logic
+_MODIFY_TYPES = frozenset(
+    {
+        ChangeType.MODIFY_FUNCTION,
+        ChangeType.MODIFY_METHOD,
+        ChangeType.MODIFY_CLASS,
+    }
+)
+
+# Structural change types that could break compilation
+_STRUCTURAL_TYPES = frozenset(
+    {
+        ChangeType.WRAP_JSX,
+        ChangeType.UNWRAP_JSX,
+        ChangeType.REMOVE_FUNCTION,
+        ChangeType.REMOVE_CLASS,
+    }
+)
+
 
 def detect_conflicts(
     task_analyses: dict[str, FileAnalysis],
@@ -203,12 +222,7 @@ def assess_severity(
         Assessed conflict severity level
     """
     # Critical: Both tasks modify core logic
-    modify_types = {
-        ChangeType.MODIFY_FUNCTION,
-        ChangeType.MODIFY_METHOD,
-        ChangeType.MODIFY_CLASS,
-    }
-    modify_count = sum(1 for ct in change_types if ct in modify_types)
+    modify_count = sum(1 for ct in change_types if ct in _MODIFY_TYPES)
 
     if modify_count >= 2:
         # Check if they modify the exact same lines
@@ -217,13 +231,7 @@ def assess_severity(
             return ConflictSeverity.CRITICAL
 
     # High: Structural changes that could break compilation
-    structural_types = {
-        ChangeType.WRAP_JSX,
-        ChangeType.UNWRAP_JSX,
-        ChangeType.REMOVE_FUNCTION,
-        ChangeType.REMOVE_CLASS,
-    }
-    if any(ct in structural_types for ct in change_types):
+    if not _STRUCTURAL_TYPES.isdisjoint(change_types):
         return ConflictSeverity.HIGH
 
     # Medium: Modifications to same function/method
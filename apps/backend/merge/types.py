@@ -136,6 +136,12 @@ class MergeDecision(Enum):
     DIRECT_COPY = "direct_copy"  # Use worktree version directly (no semantic merge)
 
 
+# Decisions that produce usable merged content
+_SUCCESSFUL_DECISIONS = frozenset(
+    {MergeDecision.AUTO_MERGED, MergeDecision.AI_MERGED, MergeDecision.DIRECT_COPY}
+)
+
+
 @dataclass
 class SemanticChange:
     """
@@ -563,11 +569,7 @@ class MergeResult:
     @property
     def success(self) -> bool:
         """Check if merge was successful."""
-        return self.decision in {
-            MergeDecision.AUTO_MERGED,
-            MergeDecision.AI_MERGED,
-            MergeDecision.DIRECT_COPY,
-        }
+        return self.decision in _SUCCESSFUL_DECISIONS
 
     @property
     def needs_human_review(self) -> bool:
@@ -84,9 +84,7 @@ def is_command_allowed(
     Returns:
         (is_allowed, reason) tuple
     """
-    allowed = profile.get_all_allowed_commands()
-
-    if command in allowed:
+    if profile.allows_command(command):
         return True, ""
 
     # Check for script commands (e.g., "./script.sh")
@@ -8,6 +8,7 @@ Coordinates stack detection, framework detection, and structure analysis.
 
 import hashlib
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -22,12 +23,16 @@ from .command_registry import (
     PACKAGE_MANAGER_COMMANDS,
     VERSION_MANAGER_COMMANDS,
 )
-from .config_parser import ConfigParser
+from .config_parser import ConfigParser, walk_tree
 from .framework_detector import FrameworkDetector
 from .models import SecurityProfile
 from .stack_detector import StackDetector
 from .structure_analyzer import StructureAnalyzer
 
+# Mixed into the project hash; bump when detection logic changes so cached
+# profiles from older analyzers are rebuilt.
+ANALYZER_VERSION = 1
+
 
 class ProjectAnalyzer:
     """
@@ -55,6 +60,8 @@ class ProjectAnalyzer:
         self.spec_dir = Path(spec_dir).resolve() if spec_dir else None
         self.profile = SecurityProfile()
         self.parser = ConfigParser(project_dir)
+        # Hash computed by should_reanalyze() during analyze(), reused when saving
+        self._current_hash: str | None = None
 
     def get_profile_path(self) -> Path:
         """Get the path where profile should be stored."""
@@ -140,6 +147,7 @@ class ProjectAnalyzer:
         ]
 
         hasher = hashlib.md5(usedforsecurity=False)
+        hasher.update(f"analyzer:{ANALYZER_VERSION}".encode())
         files_found = 0
 
         for filename in hash_files:
@@ -152,12 +160,32 @@ class ProjectAnalyzer:
                 except OSError:
                     continue
 
+        # Count source files as a proxy for project structure, used below
+        # when no config files are found
+        source_exts = [
+            "*.py",
+            "*.js",
+            "*.ts",
+            "*.go",
+            "*.rs",
+            "*.dart",
+            "*.cs",
+            "*.swift",
+            "*.kt",
+            "*.java",
+        ]
+
+        # One walk serves every "**/<pattern>" lookup, instead of a full
+        # glob of the tree per pattern on each cache check
+        matches = self._find_by_suffix(
+            {pattern[1:] for pattern in glob_patterns + source_exts}
+        )
+
         # Check glob patterns for project files that can be anywhere
         for pattern in glob_patterns:
-            for filepath in self.project_dir.glob(f"**/{pattern}"):
+            for rel_path in sorted(matches[pattern[1:]]):
                 try:
-                    stat = filepath.stat()
-                    rel_path = filepath.relative_to(self.project_dir)
+                    stat = os.stat(os.path.join(self.project_dir, rel_path))
                     hasher.update(f"{rel_path}:{stat.st_mtime}:{stat.st_size}".encode())
                     files_found += 1
                 except OSError:
@@ -166,27 +194,30 @@ class ProjectAnalyzer:
         # If no config files found, hash the project directory structure
         # to at least detect when files are added/removed
         if files_found == 0:
-            # Count source files as a proxy for project structure
-            source_exts = [
-                "*.py",
-                "*.js",
-                "*.ts",
-                "*.go",
-                "*.rs",
-                "*.dart",
-                "*.cs",
-                "*.swift",
-                "*.kt",
-                "*.java",
-            ]
             for ext in source_exts:
-                count = len(list(self.project_dir.glob(f"**/{ext}")))
+                count = len(matches[ext[1:]])
                 hasher.update(f"{ext}:{count}".encode())
             # Also include the project directory name for uniqueness
             hasher.update(self.project_dir.name.encode())
 
         return hasher.hexdigest()
 
+    def _find_by_suffix(self, suffixes: set[str]) -> dict[str, list[str]]:
+        """
+        Walk the project once, collecting relative paths of entries per suffix.
+
+        Uses walk_tree(), so dependency and cache directories (PRUNED_DIRS)
+        don't affect the hash.
+        """
+        matches: dict[str, list[str]] = {suffix: [] for suffix in suffixes}
+        for rel_dir, entries in walk_tree(str(self.project_dir)):
+            for entry in entries:
+                _, dot, ext = entry.name.rpartition(".")
+                suffix = os.path.normcase("." + ext)
+                if dot and suffix in matches:
+                    matches[suffix].append(os.path.join(rel_dir, entry.name))
+        return matches
+
     def should_reanalyze(self, profile: SecurityProfile) -> bool:
         """Check if project has changed since last analysis.
 
@@ -209,8 +240,8 @@ class ProjectAnalyzer:
             ):
                 return False
             # If validation fails, treat as non-inherited and check hash
-        current_hash = self.compute_project_hash()
-        return current_hash != profile.project_hash
+        self._current_hash = self.compute_project_hash()
+        return self._current_hash != profile.project_hash
 
     def _is_descendant_of(self, child: Path, parent: Path) -> bool:
         """Check if child path is a descendant of parent path."""
@@ -231,6 +262,7 @@ class ProjectAnalyzer:
             SecurityProfile with all detected commands
         """
         # Check for existing profile
+        self._current_hash = None
         existing = self.load_profile()
         if existing and not force and not self.should_reanalyze(existing):
             if existing.inherited_from:
@@ -247,6 +279,8 @@ class ProjectAnalyzer:
         self.profile = SecurityProfile()
         self.profile.base_commands = BASE_COMMANDS.copy()
         self.profile.project_dir = str(self.project_dir)
+        # Fresh parser so this run sees current files; detectors share its parses
+        self.parser = ConfigParser(self.project_dir)
 
         # Run detection
         self._detect_stack()
@@ -258,7 +292,9 @@ class ProjectAnalyzer:
 
         # Finalize
         self.profile.created_at = datetime.now().isoformat()
-        self.profile.project_hash = self.compute_project_hash()
+        # The hash checked against the cached profile already describes these
+        # files; re-walking the tree for it would give the same result.
+        self.profile.project_hash = self._current_hash or self.compute_project_hash()
 
         # Save
         self.save_profile(self.profile)
@@ -270,17 +306,17 @@ class ProjectAnalyzer:
 
     def _detect_stack(self) -> None:
         """Detect technology stack."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.parser)
         self.profile.detected_stack = detector.detect_all()
 
     def _detect_frameworks(self) -> None:
         """Detect frameworks from dependencies."""
-        detector = FrameworkDetector(self.project_dir)
+        detector = FrameworkDetector(self.project_dir, self.parser)
         self.profile.detected_stack.frameworks = detector.detect_all()
 
     def _detect_structure(self) -> None:
         """Detect project structure and custom scripts."""
-        analyzer = StructureAnalyzer(self.project_dir)
+        analyzer = StructureAnalyzer(self.project_dir, self.parser)
         scripts, script_commands, custom_commands = analyzer.analyze()
         self.profile.custom_scripts = scripts
         self.profile.script_commands = script_commands
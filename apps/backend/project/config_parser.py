@@ -7,7 +7,9 @@ Utilities for reading and parsing project configuration files
 """
 
 import json
+import os
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 # tomllib is available in Python 3.11+, use tomli for older versions
@@ -22,6 +24,40 @@ else:
             "Install with: pip install tomli"
         ) from None
 
+# Dependency, VCS and cache directories that never hold a project's own
+# sources or manifests. walk_tree() skips them, so every tree walk in the
+# project analysis (iter_files(), "**/*.ext" probes, the project hash) does.
+PRUNED_DIRS = frozenset(
+    {".git", "node_modules", ".venv", "venv", "__pycache__", ".tox", ".next"}
+)
+
+
+def walk_tree(root: str) -> Iterator[tuple[str, list[os.DirEntry]]]:
+    """
+    Walk a project with os.scandir, yielding (relative dir, entries) per directory.
+
+    Like Path.glob("**") it does not descend into symlinked directories; it
+    also skips PRUNED_DIRS and directories it cannot read. The root comes
+    first, with relative dir "".
+    """
+    pending = [""]
+    while pending:
+        rel_dir = pending.pop()
+        try:
+            with os.scandir(os.path.join(root, rel_dir)) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        yield rel_dir, entries
+        for entry in entries:
+            if entry.name in PRUNED_DIRS:
+                continue
+            try:
+                if entry.is_dir() and not entry.is_symlink():
+                    pending.append(os.path.join(rel_dir, entry.name))
+            except OSError:
+                pass
+
 
 class ConfigParser:
     """Parses project configuration files."""
@@ -34,27 +70,47 @@ class ConfigParser:
             project_dir: Root directory of the project
         """
         self.project_dir = Path(project_dir).resolve()
+        self._root = str(self.project_dir)
+        # Suffixes of entries at the root and anywhere in the tree, filled by
+        # one walk shared by all "*.ext" / "**/*.ext" probes. The walk only
+        # advances until the probed suffix turns up, so common languages are
+        # answered without visiting the whole project.
+        self._root_suffixes: set[str] = set()
+        self._tree_suffixes: set[str] = set()
+        self._walk: Iterator[None] | None = None
+        # Parsed JSON/TOML by filename; detectors sharing this parser read
+        # package.json and pyproject.toml once. Callers must not mutate results.
+        self._parsed: dict[str, dict | None] = {}
 
     def read_json(self, filename: str) -> dict | None:
-        """Read a JSON file from project root."""
+        """Read a JSON file from project root (parsed once per parser)."""
+        if filename in self._parsed:
+            return self._parsed[filename]
         try:
             with open(self.project_dir / filename) as f:
-                return json.load(f)
+                data = json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
-            return None
+            data = None
+        self._parsed[filename] = data
+        return data
 
     def read_toml(self, filename: str) -> dict | None:
-        """Read a TOML file from project root."""
+        """Read a TOML file from project root (parsed once per parser)."""
+        if filename in self._parsed:
+            return self._parsed[filename]
         try:
             with open(self.project_dir / filename, "rb") as f:
-                return tomllib.load(f)
+                data = tomllib.load(f)
         except FileNotFoundError:
-            return None
+            data = None
         except Exception as e:
             # Handle both tomllib.TOMLDecodeError and tomli.TOMLDecodeError
             if "TOMLDecodeError" in type(e).__name__:
-                return None
-            raise
+                data = None
+            else:
+                raise
+        self._parsed[filename] = data
+        return data
 
     def read_text(self, filename: str) -> str | None:
         """Read a text file from project root."""
@@ -69,13 +125,80 @@ class ConfigParser:
         for p in paths:
             # Handle glob patterns
             if "*" in p:
-                if list(self.project_dir.glob(p)):
+                suffix_match = self._match_suffix_pattern(p)
+                if suffix_match is not None:
+                    if suffix_match:
+                        return True
+                elif next(self.project_dir.glob(p), None) is not None:
                     return True
             else:
-                if (self.project_dir / p).exists():
+                # Literal names are probed with one stat on a plain string path;
+                # rstrip keeps Path's handling of "dir/" (file or directory).
+                if os.path.exists(os.path.join(self._root, p.rstrip("/"))):
                     return True
         return False
 
     def glob_files(self, pattern: str) -> list[Path]:
         """Find files matching a pattern."""
         return list(self.project_dir.glob(pattern))
+
+    def iter_files(self, *suffixes: str) -> Iterator[Path]:
+        """Lazily find files with any of the given suffixes, skipping PRUNED_DIRS."""
+        for rel_dir, entries in walk_tree(self._root):
+            for entry in entries:
+                try:
+                    if entry.name.endswith(suffixes) and not entry.is_dir():
+                        yield Path(self._root, rel_dir, entry.name)
+                except OSError:
+                    pass
+
+    def _match_suffix_pattern(self, pattern: str) -> bool | None:
+        """
+        Answer a "*.ext" or "**/*.ext" pattern from the cached tree scan.
+
+        Unlike Path.glob, the scan does not look inside PRUNED_DIRS.
+        Returns None for any other pattern so the caller falls back to glob.
+        """
+        recursive = pattern.startswith("**/")
+        name_pattern = pattern[3:] if recursive else pattern
+        suffix = name_pattern[1:]
+        if (
+            not name_pattern.startswith("*.")
+            or "." in suffix[1:]
+            or any(c in suffix for c in "*?[/")
+        ):
+            return None
+
+        if self._walk is None:
+            self._walk = self._scan_tree()
+            # The first step lists the root directory
+            next(self._walk, None)
+        suffix = os.path.normcase(suffix)
+        if not recursive:
+            return suffix in self._root_suffixes
+
+        if suffix in self._tree_suffixes:
+            return True
+        for _ in self._walk:
+            if suffix in self._tree_suffixes:
+                return True
+        return False
+
+    def _scan_tree(self) -> Iterator[None]:
+        """
+        Record entry-name suffixes over walk_tree().
+
+        Yields after each directory so callers can stop as soon as they have
+        their answer and resume the walk for later probes.
+        """
+        is_root = True
+        for _, entries in walk_tree(self._root):
+            for entry in entries:
+                _, dot, ext = entry.name.rpartition(".")
+                if dot:
+                    suffix = os.path.normcase("." + ext)
+                    self._tree_suffixes.add(suffix)
+            if is_root:
+                self._root_suffixes = set(self._tree_suffixes)
+                is_root = False
+            yield
@@ -11,19 +11,123 @@ from pathlib import Path
 
 from .config_parser import ConfigParser
 
+# Leading package name in a dependency spec such as "flask>=2.0"
+_PACKAGE_NAME_RE = re.compile(r"^([a-zA-Z0-9_-]+)")
+
+# package.json dependency -> framework
+NODE_FRAMEWORK_DEPS = {
+    "next": "nextjs",
+    "nuxt": "nuxt",
+    "react": "react",
+    "vue": "vue",
+    "@angular/core": "angular",
+    "svelte": "svelte",
+    "@sveltejs/kit": "svelte",
+    "astro": "astro",
+    "@remix-run/react": "remix",
+    "gatsby": "gatsby",
+    "express": "express",
+    "@nestjs/core": "nestjs",
+    "fastify": "fastify",
+    "koa": "koa",
+    "@hapi/hapi": "hapi",
+    "@adonisjs/core": "adonis",
+    "strapi": "strapi",
+    "@keystonejs/core": "keystone",
+    "payload": "payload",
+    "@directus/sdk": "directus",
+    "@medusajs/medusa": "medusa",
+    "blitz": "blitz",
+    "@redwoodjs/core": "redwood",
+    "sails": "sails",
+    "meteor": "meteor",
+    "electron": "electron",
+    "@tauri-apps/api": "tauri",
+    "@capacitor/core": "capacitor",
+    "expo": "expo",
+    "react-native": "react-native",
+    # Build tools
+    "vite": "vite",
+    "webpack": "webpack",
+    "rollup": "rollup",
+    "esbuild": "esbuild",
+    "parcel": "parcel",
+    "turbo": "turbo",
+    "nx": "nx",
+    "lerna": "lerna",
+    # Testing
+    "jest": "jest",
+    "vitest": "vitest",
+    "mocha": "mocha",
+    "@playwright/test": "playwright",
+    "cypress": "cypress",
+    "puppeteer": "puppeteer",
+    # Linting
+    "eslint": "eslint",
+    "prettier": "prettier",
+    "@biomejs/biome": "biome",
+    "oxlint": "oxlint",
+    # Database
+    "prisma": "prisma",
+    "drizzle-orm": "drizzle",
+    "typeorm": "typeorm",
+    "sequelize": "sequelize",
+    "knex": "knex",
+}
+
+# Python dependency -> framework
+PYTHON_FRAMEWORK_DEPS = {
+    "flask": "flask",
+    "django": "django",
+    "fastapi": "fastapi",
+    "starlette": "starlette",
+    "tornado": "tornado",
+    "bottle": "bottle",
+    "pyramid": "pyramid",
+    "sanic": "sanic",
+    "aiohttp": "aiohttp",
+    "celery": "celery",
+    "dramatiq": "dramatiq",
+    "rq": "rq",
+    "airflow": "airflow",
+    "prefect": "prefect",
+    "dagster": "dagster",
+    "dbt-core": "dbt",
+    "streamlit": "streamlit",
+    "gradio": "gradio",
+    "panel": "panel",
+    "dash": "dash",
+    "pytest": "pytest",
+    "tox": "tox",
+    "nox": "nox",
+    "mypy": "mypy",
+    "pyright": "pyright",
+    "ruff": "ruff",
+    "black": "black",
+    "isort": "isort",
+    "flake8": "flake8",
+    "pylint": "pylint",
+    "bandit": "bandit",
+    "coverage": "coverage",
+    "pre-commit": "pre-commit",
+    "alembic": "alembic",
+    "sqlalchemy": "sqlalchemy",
+}
+
 
 class FrameworkDetector:
     """Detects frameworks from project dependencies."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, parser: ConfigParser | None = None):
         """
         Initialize framework detector.
 
         Args:
             project_dir: Root directory of the project
+            parser: Optional config parser to share parsed files with other detectors
         """
         self.project_dir = Path(project_dir).resolve()
-        self.parser = ConfigParser(project_dir)
+        self.parser = parser or ConfigParser(project_dir)
         self.frameworks = []
 
     def detect_all(self) -> list[str]:
@@ -51,68 +155,7 @@ class FrameworkDetector:
             **pkg.get("devDependencies", {}),
         }
 
-        # Detect Node.js frameworks
-        framework_deps = {
-            "next": "nextjs",
-            "nuxt": "nuxt",
-            "react": "react",
-            "vue": "vue",
-            "@angular/core": "angular",
-            "svelte": "svelte",
-            "@sveltejs/kit": "svelte",
-            "astro": "astro",
-            "@remix-run/react": "remix",
-            "gatsby": "gatsby",
-            "express": "express",
-            "@nestjs/core": "nestjs",
-            "fastify": "fastify",
-            "koa": "koa",
-            "@hapi/hapi": "hapi",
-            "@adonisjs/core": "adonis",
-            "strapi": "strapi",
-            "@keystonejs/core": "keystone",
-            "payload": "payload",
-            "@directus/sdk": "directus",
-            "@medusajs/medusa": "medusa",
-            "blitz": "blitz",
-            "@redwoodjs/core": "redwood",
-            "sails": "sails",
-            "meteor": "meteor",
-            "electron": "electron",
-            "@tauri-apps/api": "tauri",
-            "@capacitor/core": "capacitor",
-            "expo": "expo",
-            "react-native": "react-native",
-            # Build tools
-            "vite": "vite",
-            "webpack": "webpack",
-            "rollup": "rollup",
-            "esbuild": "esbuild",
-            "parcel": "parcel",
-            "turbo": "turbo",
-            "nx": "nx",
-            "lerna": "lerna",
-            # Testing
-            "jest": "jest",
-            "vitest": "vitest",
-            "mocha": "mocha",
-            "@playwright/test": "playwright",
-            "cypress": "cypress",
-            "puppeteer": "puppeteer",
-            # Linting
-            "eslint": "eslint",
-            "prettier": "prettier",
-            "@biomejs/biome": "biome",
-            "oxlint": "oxlint",
-            # Database
-            "prisma": "prisma",
-            "drizzle-orm": "drizzle",
-            "typeorm": "typeorm",
-            "sequelize": "sequelize",
-            "knex": "knex",
-        }
-
-        for dep, framework in framework_deps.items():
+        for dep, framework in NODE_FRAMEWORK_DEPS.items():
             if dep in deps:
                 self.frameworks.append(framework)
 
@@ -136,7 +179,7 @@ class FrameworkDetector:
             if "project" in toml:
                 for dep in toml["project"].get("dependencies", []):
                     # Parse "package>=1.0" style
-                    match = re.match(r"^([a-zA-Z0-9_-]+)", dep)
+                    match = _PACKAGE_NAME_RE.match(dep)
                     if match:
                         python_deps.add(match.group(1).lower())
 
@@ -144,7 +187,7 @@ class FrameworkDetector:
             if "project" in toml and "optional-dependencies" in toml["project"]:
                 for group_deps in toml["project"]["optional-dependencies"].values():
                     for dep in group_deps:
-                        match = re.match(r"^([a-zA-Z0-9_-]+)", dep)
+                        match = _PACKAGE_NAME_RE.match(dep)
                         if match:
                             python_deps.add(match.group(1).lower())
 
@@ -159,50 +202,11 @@ class FrameworkDetector:
                 for line in content.splitlines():
                     line = line.strip()
                     if line and not line.startswith("#") and not line.startswith("-"):
-                        match = re.match(r"^([a-zA-Z0-9_-]+)", line)
+                        match = _PACKAGE_NAME_RE.match(line)
                         if match:
                             python_deps.add(match.group(1).lower())
 
-        # Detect Python frameworks from dependencies
-        python_framework_deps = {
-            "flask": "flask",
-            "django": "django",
-            "fastapi": "fastapi",
-            "starlette": "starlette",
-            "tornado": "tornado",
-            "bottle": "bottle",
-            "pyramid": "pyramid",
-            "sanic": "sanic",
-            "aiohttp": "aiohttp",
-            "celery": "celery",
-            "dramatiq": "dramatiq",
-            "rq": "rq",
-            "airflow": "airflow",
-            "prefect": "prefect",
-            "dagster": "dagster",
-            "dbt-core": "dbt",
-            "streamlit": "streamlit",
-            "gradio": "gradio",
-            "panel": "panel",
-            "dash": "dash",
-            "pytest": "pytest",
-            "tox": "tox",
-            "nox": "nox",
-            "mypy": "mypy",
-            "pyright": "pyright",
-            "ruff": "ruff",
-            "black": "black",
-            "isort": "isort",
-            "flake8": "flake8",
-            "pylint": "pylint",
-            "bandit": "bandit",
-            "coverage": "coverage",
-            "pre-commit": "pre-commit",
-            "alembic": "alembic",
-            "sqlalchemy": "sqlalchemy",
-        }
-
-        for dep, framework in python_framework_deps.items():
+        for dep, framework in PYTHON_FRAMEWORK_DEPS.items():
             if dep in python_deps:
                 self.frameworks.append(framework)
 
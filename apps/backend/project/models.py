@@ -65,6 +65,15 @@ class SecurityProfile:
             | self.custom_commands
         )
 
+    def allows_command(self, command: str) -> bool:
+        """Check if a command is in any allowed set, without building their union."""
+        return (
+            command in self.base_commands
+            or command in self.stack_commands
+            or command in self.script_commands
+            or command in self.custom_commands
+        )
+
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict."""
         result = {
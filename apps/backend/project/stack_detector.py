@@ -15,15 +15,16 @@ from .models import TechnologyStack
 class StackDetector:
     """Detects technology stack from project structure."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, parser: ConfigParser | None = None):
         """
         Initialize stack detector.
 
         Args:
             project_dir: Root directory of the project
+            parser: Optional config parser to share parsed files with other detectors
         """
         self.project_dir = Path(project_dir).resolve()
-        self.parser = ConfigParser(project_dir)
+        self.parser = parser or ConfigParser(project_dir)
         self.stack = TechnologyStack()
 
     def detect_all(self) -> TechnologyStack:
@@ -240,13 +241,11 @@ class StackDetector:
             self.stack.infrastructure.append("podman")
 
         # Kubernetes
-        if self.parser.file_exists(
-            "k8s/", "kubernetes/", "*.yaml"
-        ) or self.parser.glob_files("**/deployment.yaml"):
+        if self.parser.file_exists("k8s/", "kubernetes/", "*.yaml") or any(
+            path.name == "deployment.yaml" for path in self.parser.iter_files(".yaml")
+        ):
             # Check if YAML files contain k8s resources
-            for yaml_file in self.parser.glob_files(
-                "**/*.yaml"
-            ) + self.parser.glob_files("**/*.yml"):
+            for yaml_file in self.parser.iter_files(".yaml", ".yml"):
                 try:
                     with open(yaml_file) as f:
                         content = f.read()
@@ -261,7 +260,7 @@ class StackDetector:
             self.stack.infrastructure.append("helm")
 
         # Terraform
-        if self.parser.glob_files("**/*.tf"):
+        if self.parser.file_exists("**/*.tf"):
             self.stack.infrastructure.append("terraform")
 
         # Ansible
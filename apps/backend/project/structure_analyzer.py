@@ -13,21 +13,25 @@ from pathlib import Path
 from .config_parser import ConfigParser
 from .models import CustomScripts
 
+# Makefile target definition like "target:" or "target: deps"
+_MAKE_TARGET_RE = re.compile(r"^([a-zA-Z_][a-zA-Z0-9_-]*)\s*:")
+
 
 class StructureAnalyzer:
     """Analyzes project structure for custom scripts."""
 
     CUSTOM_ALLOWLIST_FILENAME = ".auto-claude-allowlist"
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, parser: ConfigParser | None = None):
         """
         Initialize structure analyzer.
 
         Args:
             project_dir: Root directory of the project
+            parser: Optional config parser to share parsed files with other detectors
         """
         self.project_dir = Path(project_dir).resolve()
-        self.parser = ConfigParser(project_dir)
+        self.parser = parser or ConfigParser(project_dir)
         self.custom_scripts = CustomScripts()
         self.custom_commands = set()
         self.script_commands = set()
@@ -73,8 +77,7 @@ class StructureAnalyzer:
             return
 
         for line in content.splitlines():
-            # Match target definitions like "target:" or "target: deps"
-            match = re.match(r"^([a-zA-Z_][a-zA-Z0-9_-]*)\s*:", line)
+            match = _MAKE_TARGET_RE.match(line)
             if match:
                 target = match.group(1)
                 # Skip common internal targets
@@ -181,6 +181,16 @@ AI_BOT_PATTERNS: dict[str, str] = {
     "percy[bot]": "Percy",
 }
 
+# All AI_BOT_PATTERNS folded into one alternation (in declaration order), so an
+# author is classified with a single regex search instead of a Python loop.
+_AI_BOT_RE = re.compile("|".join(re.escape(pattern) for pattern in AI_BOT_PATTERNS))
+
+
+def _match_ai_bot(author: str) -> str | None:
+    """Return the AI tool name for a lowercased author login, or None."""
+    match = _AI_BOT_RE.search(author)
+    return AI_BOT_PATTERNS[match.group(0)] if match else None
+
 
 @dataclass
 class PRContext:
@@ -274,8 +284,8 @@ class PRContextGatherer:
         related_files = self._find_related_files(changed_files)
         safe_print(f"[Context] Found {len(related_files)} related files")
 
-        # Fetch commits
-        commits = await self._fetch_commits()
+        # Commits come with the metadata query
+        commits = pr_data.get("commits", [])
         safe_print(f"[Context] Fetched {len(commits)} commits")
 
         # Fetch AI bot comments for triage
@@ -341,6 +351,7 @@ class PRContextGatherer:
                 "labels",
                 "mergeable",  # MERGEABLE, CONFLICTING, or UNKNOWN
                 "mergeStateStatus",  # BEHIND, BLOCKED, CLEAN, DIRTY, HAS_HOOKS, UNKNOWN, UNSTABLE
+                "commits",  # Fetched here to save a second `gh pr view` round trip
             ],
         )
 
@@ -598,14 +609,6 @@ class PRContextGatherer:
             )
             return ""
 
-    async def _fetch_commits(self) -> list[dict]:
-        """Fetch commit history for this PR."""
-        try:
-            data = await self.gh_client.pr_get(self.pr_number, json_fields=["commits"])
-            return data.get("commits", [])
-        except Exception:
-            return []
-
     async def _fetch_ai_bot_comments(self) -> list[AIBotComment]:
         """
         Fetch comments from AI code review tools on this PR.
@@ -660,12 +663,7 @@ class PRContextGatherer:
             author = (user_data.get("login", "") if user_data else "").lower()
 
         # Check if author matches any known AI bot pattern
-        tool_name = None
-        for pattern, name in AI_BOT_PATTERNS.items():
-            if pattern in author or author == pattern:
-                tool_name = name
-                break
-
+        tool_name = _match_ai_bot(author)
         if not tool_name:
             return None
 
@@ -1154,7 +1152,7 @@ class FollowupContextGatherer:
             elif isinstance(comment.get("author"), dict):
                 author = comment["author"].get("login", "").lower()
 
-            is_ai_bot = any(pattern in author for pattern in AI_BOT_PATTERNS.keys())
+            is_ai_bot = _match_ai_bot(author) is not None
 
             if is_ai_bot:
                 ai_comments.append(comment)
@@ -1170,7 +1168,7 @@ class FollowupContextGatherer:
             if isinstance(review.get("user"), dict):
                 author = review["user"].get("login", "").lower()
 
-            is_ai_bot = any(pattern in author for pattern in AI_BOT_PATTERNS.keys())
+            is_ai_bot = _match_ai_bot(author) is not None
 
             if is_ai_bot:
                 ai_reviews.append(review)
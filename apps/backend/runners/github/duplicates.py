@@ -220,6 +220,9 @@ class EmbeddingProvider:
         self.provider = provider
         self.api_key = api_key
         self.model = model or self._default_model()
+        # Loaded on first local embedding and reused; loading the model costs
+        # far more than encoding one issue
+        self._local_model = None
 
     def _default_model(self) -> str:
         defaults = {
@@ -280,10 +283,11 @@ class EmbeddingProvider:
     async def _local_embedding(self, text: str) -> list[float]:
         """Get embedding from local model."""
         try:
-            from sentence_transformers import SentenceTransformer
+            if self._local_model is None:
+                from sentence_transformers import SentenceTransformer
 
-            model = SentenceTransformer(self.model)
-            embedding = model.encode(text[:8000])
+                self._local_model = SentenceTransformer(self.model)
+            embedding = self._local_model.encode(text[:8000])
             return embedding.tolist()
         except Exception as e:
             logger.error(f"Local embedding error: {e}")
@@ -373,8 +373,11 @@ async def locked_json_write(
     Raises:
         FileLockTimeout: If lock cannot be acquired within timeout
     """
+    # Serialize on the loop: other coroutines may mutate data while a worker
+    # thread walks it. Only the file write goes to the thread pool.
+    text = json.dumps(data, indent=indent)
     async with locked_write(filepath, timeout=timeout) as f:
-        json.dump(data, f, indent=indent)
+        await asyncio.get_running_loop().run_in_executor(None, f.write, text)
 
 
 async def locked_json_read(filepath: str | Path, timeout: float = 5.0) -> Any:
@@ -397,7 +400,7 @@ async def locked_json_read(filepath: str | Path, timeout: float = 5.0) -> Any:
         json.JSONDecodeError: If file contains invalid JSON
     """
     async with locked_read(filepath, timeout=timeout) as f:
-        return json.load(f)
+        return await asyncio.get_running_loop().run_in_executor(None, json.load, f)
 
 
 async def locked_json_update(
@@ -458,13 +461,13 @@ async def locked_json_update(
             ),
         )
 
-        try:
+        def _write_json():
             with os.fdopen(fd, "w") as f:
                 json.dump(updated_data, f, indent=indent)
+            os.replace(tmp_path, filepath)
 
-            await asyncio.get_running_loop().run_in_executor(
-                None, os.replace, tmp_path, filepath
-            )
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, _write_json)
 
         except Exception:
             try:
@@ -4,7 +4,7 @@ GitHub CLI Client with Timeout and Retry Logic
 
 Wrapper for gh CLI commands that prevents hung processes through:
 - Configurable timeouts (default 30s)
-- Exponential backoff retry (3 attempts: 1s, 2s, 4s)
+- Exponential backoff retry with jitter (3 attempts: 1s, 2s, 4s)
 - Structured logging for monitoring
 - Async subprocess execution for non-blocking operations
 
@@ -16,6 +16,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import random
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -29,6 +30,34 @@ except (ImportError, ValueError, SystemError):
 logger = logging.getLogger(__name__)
 
 
+# Outcome buckets for `gh pr checks` states. Anything not listed (PENDING,
+# QUEUED, IN_PROGRESS, ...) is still running.
+_CHECK_PASSED = "passed"
+_CHECK_FAILED = "failed"
+_CHECK_PENDING = "pending"
+
+_CHECK_STATE_OUTCOMES: dict[str, str] = {
+    "SUCCESS": _CHECK_PASSED,
+    "NEUTRAL": _CHECK_PASSED,
+    "SKIPPED": _CHECK_PASSED,
+    "FAILURE": _CHECK_FAILED,
+    "TIMED_OUT": _CHECK_FAILED,
+    "CANCELLED": _CHECK_FAILED,
+    "STARTUP_FAILURE": _CHECK_FAILED,
+}
+
+
+def _backoff_delay(attempt: int) -> float:
+    """
+    Delay before retrying after a failed attempt: 1s, 2s, 4s, ...
+
+    Up to 20% jitter is added so calls that fail together (for example the
+    concurrent fetches in get_pr_checks_comprehensive) don't retry in lockstep.
+    """
+    base = 2 ** (attempt - 1)
+    return base + random.uniform(0, 0.2) * base
+
+
 class GHTimeoutError(Exception):
     """Raised when gh CLI command times out after all retry attempts."""
 
@@ -47,7 +76,7 @@ class PRTooLargeError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GHCommandResult:
     """Result of a gh CLI command execution."""
 
@@ -172,7 +201,7 @@ class GHClient:
                         logger.warning(f"Failed to kill hung process: {e}")
 
                     # Calculate backoff delay
-                    backoff_delay = 2 ** (attempt - 1)
+                    backoff_delay = _backoff_delay(attempt)
 
                     logger.warning(
                         f"gh {args[0]} timed out after {timeout}s "
@@ -181,7 +210,7 @@ class GHClient:
 
                     # Retry if attempts remain
                     if attempt < self.max_retries:
-                        logger.info(f"Retrying in {backoff_delay}s...")
+                        logger.info(f"Retrying in {backoff_delay:.1f}s...")
                         await asyncio.sleep(backoff_delay)
                         continue
                     else:
@@ -250,8 +279,8 @@ class GHClient:
                     raise GHCommandError(f"gh {args[0]} failed: {str(e)}")
                 else:
                     # Retry on unexpected errors too
-                    backoff_delay = 2 ** (attempt - 1)
-                    logger.info(f"Retrying in {backoff_delay}s after error...")
+                    backoff_delay = _backoff_delay(attempt)
+                    logger.info(f"Retrying in {backoff_delay:.1f}s after error...")
                     await asyncio.sleep(backoff_delay)
                     continue
 
@@ -798,18 +827,29 @@ class GHClient:
         """
         Get the current HEAD SHA of a PR.
 
+        Only the headRefOid field is requested and projected with --jq, so the
+        full commit list is never transferred or parsed.
+
         Args:
             pr_number: PR number
 
         Returns:
             HEAD commit SHA or None if not found
         """
-        data = await self.pr_get(pr_number, json_fields=["commits"])
-        commits = data.get("commits", [])
-        if commits:
-            # Last commit is the HEAD
-            return commits[-1].get("oid")
-        return None
+        args = [
+            "pr",
+            "view",
+            str(pr_number),
+            "--json",
+            "headRefOid",
+            "--jq",
+            ".headRefOid",
+        ]
+        args = self._add_repo_flag(args)
+
+        result = await self.run(args, timeout=30.0)
+        head_sha = result.stdout.strip()
+        return head_sha or None
 
     async def get_pr_checks(self, pr_number: int) -> dict[str, Any]:
         """
@@ -844,15 +884,15 @@ class GHClient:
             failed_checks = []
 
             for check in checks:
-                state = check.get("state", "").upper()
-                name = check.get("name", "Unknown")
-
                 # gh pr checks 'state' directly contains: SUCCESS, FAILURE, PENDING, NEUTRAL, etc.
-                if state in ("SUCCESS", "NEUTRAL", "SKIPPED"):
+                outcome = _CHECK_STATE_OUTCOMES.get(
+                    check.get("state", "").upper(), _CHECK_PENDING
+                )
+                if outcome == _CHECK_PASSED:
                     passing += 1
-                elif state in ("FAILURE", "TIMED_OUT", "CANCELLED", "STARTUP_FAILURE"):
+                elif outcome == _CHECK_FAILED:
                     failing += 1
-                    failed_checks.append(name)
+                    failed_checks.append(check.get("name", "Unknown"))
                 else:
                     # PENDING, QUEUED, IN_PROGRESS, etc.
                     pending += 1
@@ -893,11 +933,7 @@ class GHClient:
         """
         try:
             # First, get the PR's head SHA to filter workflow runs
-            pr_args = ["pr", "view", str(pr_number), "--json", "headRefOid"]
-            pr_args = self._add_repo_flag(pr_args)
-            pr_result = await self.run(pr_args, timeout=30.0)
-            pr_data = json.loads(pr_result.stdout) if pr_result.stdout.strip() else {}
-            head_sha = pr_data.get("headRefOid", "")
+            head_sha = await self.get_pr_head_sha(pr_number)
 
             if not head_sha:
                 return {
@@ -980,11 +1016,19 @@ class GHClient:
         Returns:
             Dict with all check information including awaiting_approval count
         """
-        # Get standard checks
-        checks = await self.get_pr_checks(pr_number)
-
-        # Get workflows awaiting approval
-        awaiting = await self.get_workflows_awaiting_approval(pr_number)
+        # Standard checks and workflows awaiting approval are independent gh
+        # calls, so run them concurrently. Both helpers let RateLimitExceeded
+        # through; wait for both calls to finish so neither is left running
+        # unobserved, then re-raise the first error.
+        results = await asyncio.gather(
+            self.get_pr_checks(pr_number),
+            self.get_workflows_awaiting_approval(pr_number),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        checks, awaiting = results
 
         # Merge the results
         checks["awaiting_approval"] = awaiting.get("awaiting_approval", 0)
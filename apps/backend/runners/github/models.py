@@ -15,6 +15,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .services.pydantic_models import ValidationStatus
 
 try:
     from .file_lock import locked_json_update, locked_json_write
@@ -211,7 +215,7 @@ class AutoFixStatus(str, Enum):
         return new_state in valid_transitions.get(self, set())
 
 
-@dataclass
+@dataclass(slots=True)
 class PRReviewFinding:
     """A single finding from a PR review."""
 
@@ -233,12 +237,13 @@ class PRReviewFinding:
     redundant_with: str | None = None  # Reference to duplicate code (file:line)
 
     # Finding validation fields (from finding-validator re-investigation)
-    validation_status: str | None = (
-        None  # confirmed_valid, dismissed_false_positive, needs_human_review
-    )
+    validation_status: ValidationStatus | None = None
     validation_evidence: str | None = None  # Code snippet examined during validation
     validation_explanation: str | None = None  # Why finding was validated/dismissed
 
+    # Actionability score set by FindingValidator; not persisted or compared
+    confidence: float = field(default=0.0, compare=False, repr=False)
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
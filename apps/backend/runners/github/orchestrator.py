@@ -77,8 +77,11 @@ except (ImportError, ValueError, SystemError):
     )
     from services.io_utils import safe_print
 
+# Severities that block a merge, shared by the per-finding verdict checks
+_BLOCKING_SEVERITIES = frozenset({ReviewSeverity.CRITICAL, ReviewSeverity.HIGH})
 
-@dataclass
+
+@dataclass(slots=True)
 class ProgressCallback:
     """Callback for progress updates."""
 
@@ -852,7 +855,7 @@ class GitHubOrchestrator:
             f
             for f in findings
             if f.category == ReviewCategory.REDUNDANCY
-            and f.severity in (ReviewSeverity.CRITICAL, ReviewSeverity.HIGH)
+            and f.severity in _BLOCKING_SEVERITIES
         ]
 
         # Security findings are always blockers
@@ -862,9 +865,7 @@ class GitHubOrchestrator:
 
         # Structural blockers
         structural_blockers = [
-            s
-            for s in structural_issues
-            if s.severity in (ReviewSeverity.CRITICAL, ReviewSeverity.HIGH)
+            s for s in structural_issues if s.severity in _BLOCKING_SEVERITIES
         ]
 
         # AI comments marked critical
@@ -1023,10 +1024,7 @@ class GitHubOrchestrator:
             for s in structural_issues
             if s.issue_type in ("feature_creep", "scope_creep")
         ]
-        if any(
-            s.severity in (ReviewSeverity.CRITICAL, ReviewSeverity.HIGH)
-            for s in scope_issues
-        ):
+        if any(s.severity in _BLOCKING_SEVERITIES for s in scope_issues):
             scope_coherence = "poor"
         elif scope_issues:
             scope_coherence = "mixed"
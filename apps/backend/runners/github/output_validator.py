@@ -409,7 +409,7 @@ class FindingValidator:
             True if meets threshold, False otherwise
         """
         # If finding has explicit confidence field, use it
-        if hasattr(finding, "confidence") and finding.confidence:
+        if finding.confidence:
             return finding.confidence >= self.HIGH_ACTIONABILITY_SCORE
 
         # Otherwise, use actionability score as proxy for confidence
@@ -433,10 +433,8 @@ class FindingValidator:
             Enhanced finding
         """
         # Add actionability score as confidence if not already present
-        if not hasattr(finding, "confidence") or not finding.confidence:
-            actionability = self._score_actionability(finding)
-            # Add as custom attribute (not in dataclass, but accessible)
-            finding.__dict__["confidence"] = actionability
+        if not finding.confidence:
+            finding.confidence = self._score_actionability(finding)
 
         # Ensure fixable is set correctly based on having a suggested fix
         if (
@@ -499,7 +497,7 @@ class FindingValidator:
             category_counts[finding.category.value] += 1
 
             # Get actionability score
-            if hasattr(finding, "confidence") and finding.confidence:
+            if finding.confidence:
                 total_actionability += finding.confidence
             else:
                 total_actionability += self._score_actionability(finding)
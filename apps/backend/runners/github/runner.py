@@ -92,6 +92,21 @@ def print_progress(callback: ProgressCallback) -> None:
     safe_print(f"{prefix}[{callback.progress:3d}%] {callback.message}")
 
 
+def run_async(coro):
+    """
+    Run a coroutine to completion on uvloop when available.
+
+    uvloop speeds up the subprocess and socket waits that dominate gh CLI
+    polling. It is optional (and unavailable on Windows), so fall back to
+    the stdlib event loop when it cannot be imported.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
 def get_config(args) -> GitHubRunnerConfig:
     """Build config from CLI args and environment."""
     import shutil
@@ -826,7 +841,7 @@ def main():
             },
         )
 
-        exit_code = asyncio.run(handler(args))
+        exit_code = run_async(handler(args))
         sys.exit(exit_code)
     except KeyboardInterrupt:
         safe_print("\nInterrupted.")
@@ -62,6 +62,9 @@ _SEVERITY_MAPPING = {
     "low": ReviewSeverity.LOW,
 }
 
+# Critical and High findings always block a merge
+_BLOCKING_SEVERITIES = frozenset({ReviewSeverity.CRITICAL, ReviewSeverity.HIGH})
+
 
 class FollowupReviewer:
     """
@@ -483,11 +486,11 @@ class FollowupReviewer:
 
         # Critical and High are always blockers
         for f in unresolved_findings:
-            if f.severity in [ReviewSeverity.CRITICAL, ReviewSeverity.HIGH]:
+            if f.severity in _BLOCKING_SEVERITIES:
                 blockers.append(f"Unresolved: {f.title} ({f.file}:{f.line})")
 
         for f in new_findings:
-            if f.severity in [ReviewSeverity.CRITICAL, ReviewSeverity.HIGH]:
+            if f.severity in _BLOCKING_SEVERITIES:
                 blockers.append(f"New issue: {f.title}")
 
         # Determine verdict
@@ -46,7 +46,7 @@ try:
     from .category_utils import map_category
     from .io_utils import safe_print
     from .pr_worktree_manager import PRWorktreeManager
-    from .pydantic_models import ParallelFollowupResponse
+    from .pydantic_models import ParallelFollowupResponse, count_validation_statuses
     from .sdk_utils import process_sdk_stream
 except (ImportError, ValueError, SystemError):
     from context_gatherer import _validate_git_ref
@@ -65,7 +65,10 @@ except (ImportError, ValueError, SystemError):
     from services.category_utils import map_category
     from services.io_utils import safe_print
     from services.pr_worktree_manager import PRWorktreeManager
-    from services.pydantic_models import ParallelFollowupResponse
+    from services.pydantic_models import (
+        ParallelFollowupResponse,
+        count_validation_statuses,
+    )
     from services.sdk_utils import process_sdk_stream
 
 
@@ -877,16 +880,9 @@ The SDK will run invoked agents in parallel automatically.
             verdict = verdict_map.get(response.verdict, MergeVerdict.NEEDS_REVISION)
 
             # Count validation results
-            confirmed_valid_count = sum(
-                1
-                for fv in response.finding_validations
-                if fv.validation_status == "confirmed_valid"
-            )
-            needs_human_count = sum(
-                1
-                for fv in response.finding_validations
-                if fv.validation_status == "needs_human_review"
-            )
+            validation_counts = count_validation_statuses(response.finding_validations)
+            confirmed_valid_count = validation_counts["confirmed_valid"]
+            needs_human_count = validation_counts["needs_human_review"]
 
             # Log findings summary for verification
             safe_print(
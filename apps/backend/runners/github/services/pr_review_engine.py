@@ -39,7 +39,7 @@ except (ImportError, ValueError, SystemError):
 
 
 # Define a local ProgressCallback to avoid circular import
-@dataclass
+@dataclass(slots=True)
 class ProgressCallback:
     """Callback for progress updates - local definition to avoid circular import."""
 
@@ -24,7 +24,9 @@ Usage:
 
 from __future__ import annotations
 
-from typing import Literal
+from collections import Counter
+from collections.abc import Iterable
+from typing import Literal, get_args
 
 from pydantic import BaseModel, Field
 
@@ -581,6 +583,12 @@ class ParallelFollowupResponse(BaseModel):
 # =============================================================================
 
 
+ValidationStatus = Literal[
+    "confirmed_valid", "dismissed_false_positive", "needs_human_review"
+]
+VALIDATION_STATUSES: frozenset[str] = frozenset(get_args(ValidationStatus))
+
+
 class FindingValidationResult(BaseModel):
     """
     Result of re-investigating an unresolved finding to validate it's actually real.
@@ -593,9 +601,7 @@ class FindingValidationResult(BaseModel):
     """
 
     finding_id: str = Field(description="ID of the finding being validated")
-    validation_status: Literal[
-        "confirmed_valid", "dismissed_false_positive", "needs_human_review"
-    ] = Field(
+    validation_status: ValidationStatus = Field(
         description=(
             "Validation result: "
             "confirmed_valid = code evidence proves issue IS real; "
@@ -643,3 +649,10 @@ class FindingValidationResponse(BaseModel):
             "how many dismissed, how many need human review"
         )
     )
+
+
+def count_validation_statuses(
+    validations: Iterable[FindingValidationResult],
+) -> Counter[str]:
+    """Tally validation results by validation_status in a single pass."""
+    return Counter(fv.validation_status for fv in validations)
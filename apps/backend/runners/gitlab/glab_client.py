@@ -3,11 +3,13 @@ GitLab API Client
 =================
 
 Client for GitLab API operations.
-Uses direct API calls with PRIVATE-TOKEN authentication.
+Uses direct API calls with PRIVATE-TOKEN authentication over a
+keep-alive connection that is reused across requests.
 """
 
 from __future__ import annotations
 
+import http.client
 import json
 import time
 import urllib.parse
@@ -44,6 +46,11 @@ VALID_ENDPOINT_PATTERNS = (
 )
 
 
+# Methods that are safe to send twice: a dropped keep-alive connection is
+# retried and redirects are followed only for these.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+
 def validate_endpoint(endpoint: str) -> None:
     """
     Validate that an endpoint is a legitimate GitLab API path.
@@ -83,6 +90,109 @@ class GitLabClient:
         self.project_dir = Path(project_dir)
         self.config = config
         self.default_timeout = default_timeout
+        self._connection: http.client.HTTPConnection | None = None
+
+    def __enter__(self) -> GitLabClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled keep-alive connection, if any."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _get_connection(self, timeout: float) -> http.client.HTTPConnection:
+        """Return the pooled connection to the GitLab instance, opening it lazily."""
+        if self._connection is None:
+            parsed = urllib.parse.urlsplit(self.config.instance_url)
+            if parsed.scheme == "https":
+                self._connection = http.client.HTTPSConnection(
+                    parsed.netloc, timeout=timeout
+                )
+            else:
+                self._connection = http.client.HTTPConnection(
+                    parsed.netloc, timeout=timeout
+                )
+        self._connection.timeout = timeout
+        if self._connection.sock is not None:
+            self._connection.sock.settimeout(timeout)
+        return self._connection
+
+    def _send(
+        self,
+        url: str,
+        method: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, Any, bytes]:
+        """
+        Send one HTTP request and return (status, headers, body).
+
+        Requests go over a single keep-alive connection so repeated API calls
+        skip the TCP/TLS handshake. Proxied requests go through urllib, as do
+        redirects of idempotent requests. Writes are never sent twice: a
+        dropped connection raises and a 3xx answer is returned as-is.
+        """
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme in urllib.request.getproxies():
+            return self._send_urllib(url, method, body, headers, timeout)
+
+        path = parsed.path or "/"
+        if parsed.query:
+            path = f"{path}?{parsed.query}"
+
+        idempotent = method.upper() in _IDEMPOTENT_METHODS
+        try:
+            result = self._send_pooled(path, method, body, headers, timeout)
+        except (http.client.HTTPException, ConnectionError):
+            # The server may have dropped the idle keep-alive connection.
+            # Only reads are retried on a fresh one: a write may already
+            # have been applied before the connection went away.
+            if not idempotent:
+                raise
+            result = self._send_pooled(path, method, body, headers, timeout)
+
+        if idempotent and 300 <= result[0] < 400:
+            return self._send_urllib(url, method, body, headers, timeout)
+        return result
+
+    def _send_pooled(
+        self,
+        path: str,
+        method: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, Any, bytes]:
+        """Send a request over the pooled connection."""
+        conn = self._get_connection(timeout)
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            return response.status, response.headers, response.read()
+        except (OSError, http.client.HTTPException):
+            self.close()
+            raise
+
+    def _send_urllib(
+        self,
+        url: str,
+        method: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, Any, bytes]:
+        """Send a request with urllib on a one-off connection."""
+        req = urllib.request.Request(url, data=body, headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers, e.read() if e.fp else b""
 
     def _api_url(self, endpoint: str) -> str:
         """Build full API URL."""
@@ -113,62 +223,57 @@ class GitLabClient:
 
         last_error = None
         for attempt in range(max_retries):
-            req = urllib.request.Request(
+            status, response_headers, response_body = self._send(
                 url,
-                data=request_data,
-                headers=headers,
-                method=method,
+                method,
+                request_data,
+                headers,
+                timeout or self.default_timeout,
             )
 
-            try:
-                with urllib.request.urlopen(
-                    req, timeout=timeout or self.default_timeout
-                ) as response:
-                    if response.status == 204:
-                        return None
-                    response_body = response.read().decode("utf-8")
+            if status < 400:
+                if status == 204:
+                    return None
+                try:
+                    return json.loads(response_body.decode("utf-8"))
+                except json.JSONDecodeError as e:
+                    raise Exception(f"Invalid JSON response from GitLab: {e}") from e
+
+            error_body = response_body.decode("utf-8")
+            last_error = Exception(f"GitLab API error {status}: {error_body}")
+
+            # Handle rate limit (429) with exponential backoff
+            if status == 429:
+                # Default to exponential backoff: 1s, 2s, 4s
+                wait_time = 2**attempt
+
+                # Check for Retry-After header (can be integer seconds or HTTP-date)
+                retry_after = response_headers.get("Retry-After")
+                if retry_after:
                     try:
-                        return json.loads(response_body)
-                    except json.JSONDecodeError as e:
-                        raise Exception(
-                            f"Invalid JSON response from GitLab: {e}"
-                        ) from e
-            except urllib.error.HTTPError as e:
-                error_body = e.read().decode("utf-8") if e.fp else ""
-                last_error = e
-
-                # Handle rate limit (429) with exponential backoff
-                if e.code == 429:
-                    # Default to exponential backoff: 1s, 2s, 4s
-                    wait_time = 2**attempt
-
-                    # Check for Retry-After header (can be integer seconds or HTTP-date)
-                    retry_after = e.headers.get("Retry-After")
-                    if retry_after:
+                        # Try parsing as integer seconds first
+                        wait_time = int(retry_after)
+                    except ValueError:
+                        # Try parsing as HTTP-date (e.g., "Wed, 21 Oct 2015 07:28:00 GMT")
                         try:
-                            # Try parsing as integer seconds first
-                            wait_time = int(retry_after)
-                        except ValueError:
-                            # Try parsing as HTTP-date (e.g., "Wed, 21 Oct 2015 07:28:00 GMT")
-                            try:
-                                retry_date = parsedate_to_datetime(retry_after)
-                                now = datetime.now(timezone.utc)
-                                delta = (retry_date - now).total_seconds()
-                                wait_time = max(1, int(delta))  # At least 1 second
-                            except (ValueError, TypeError):
-                                # Parsing failed, keep exponential backoff default
-                                pass
-
-                    if attempt < max_retries - 1:
-                        print(
-                            f"[GitLab] Rate limited (429). Retrying in {wait_time}s "
-                            f"(attempt {attempt + 1}/{max_retries})...",
-                            flush=True,
-                        )
-                        time.sleep(wait_time)
-                        continue
-
-                raise Exception(f"GitLab API error {e.code}: {error_body}") from e
+                            retry_date = parsedate_to_datetime(retry_after)
+                            now = datetime.now(timezone.utc)
+                            delta = (retry_date - now).total_seconds()
+                            wait_time = max(1, int(delta))  # At least 1 second
+                        except (ValueError, TypeError):
+                            # Parsing failed, keep exponential backoff default
+                            pass
+
+                if attempt < max_retries - 1:
+                    print(
+                        f"[GitLab] Rate limited (429). Retrying in {wait_time}s "
+                        f"(attempt {attempt + 1}/{max_retries})...",
+                        flush=True,
+                    )
+                    time.sleep(wait_time)
+                    continue
+
+            raise last_error
 
         # Should not reach here, but just in case
         raise Exception(f"GitLab API error after {max_retries} retries") from last_error
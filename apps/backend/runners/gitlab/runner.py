@@ -139,7 +139,10 @@ async def cmd_review_mr(args) -> int:
     safe_print("[DEBUG] Orchestrator created")
 
     safe_print(f"[DEBUG] Calling orchestrator.review_mr({args.mr_iid})...")
-    result = await orchestrator.review_mr(args.mr_iid)
+    try:
+        result = await orchestrator.review_mr(args.mr_iid)
+    finally:
+        orchestrator.client.close()
     safe_print(f"[DEBUG] review_mr returned, success={result.success}")
 
     if result.success:
@@ -194,6 +197,8 @@ async def cmd_followup_review_mr(args) -> int:
     except ValueError as e:
         print(f"\nFollow-up review failed: {e}")
         return 1
+    finally:
+        orchestrator.client.close()
 
     safe_print(f"[DEBUG] followup_review_mr returned, success={result.success}")
 
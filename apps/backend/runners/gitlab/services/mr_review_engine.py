@@ -46,7 +46,7 @@ except ImportError:
     from core.io_utils import safe_print
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressCallback:
     """Callback for progress updates."""
 
@@ -28,6 +28,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+# How often to re-check services that are not yet accepting connections
+HEALTH_CHECK_INTERVAL_SECONDS = 0.5
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -434,23 +437,20 @@ class ServiceOrchestrator:
         Returns:
             True if all services became healthy
         """
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            all_healthy = True
-
-            for service in self._services:
-                if service.port:
-                    if not self._check_port(service.port):
-                        all_healthy = False
-                        break
+        deadline = time.monotonic() + timeout
+        pending = {service.port for service in self._services if service.port}
 
-            if all_healthy:
+        while True:
+            # Only ports that have not come up yet are checked again
+            pending = {port for port in pending if not self._check_port(port)}
+            if not pending:
                 return True
 
-            time.sleep(2)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
 
-        return False
+            time.sleep(min(HEALTH_CHECK_INTERVAL_SECONDS, remaining))
 
     def _check_port(self, port: int) -> bool:
         """Check if a port is responding."""
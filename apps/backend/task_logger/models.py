@@ -2,7 +2,7 @@
 Data models for task logging.
 """
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
 
 
@@ -27,7 +27,7 @@ class LogEntryType(str, Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """A single log entry."""
 
@@ -50,7 +50,16 @@ class LogEntry:
 
     def to_dict(self) -> dict:
         """Convert to dictionary, excluding None values."""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        return {
+            name: value
+            for name in _LOG_ENTRY_FIELDS
+            if (value := getattr(self, name)) is not None
+        }
+
+
+# Every field is a scalar, so to_dict reads attributes directly instead of
+# paying for asdict()'s recursive deep copy on each log line.
+_LOG_ENTRY_FIELDS = tuple(f.name for f in fields(LogEntry))
 
 
 @dataclass
@@ -6,12 +6,14 @@ Pytest Configuration and Shared Fixtures
 Provides common test fixtures for the Auto-Build Framework test suite.
 """
 
+import ast
+import functools
 import json
 import os
 import shutil
 import subprocess
 import sys
-import tempfile
+from datetime import datetime
 from pathlib import Path
 from typing import Generator
 from unittest.mock import MagicMock
@@ -42,8 +44,12 @@ if 'claude_code_sdk' not in sys.modules:
     sys.modules['claude_code_sdk'] = _create_sdk_mock()
     sys.modules['claude_code_sdk.types'] = MagicMock()
 
-# Add apps/backend directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+BACKEND_DIR = Path(__file__).parent.parent / "apps" / "backend"
+
+# Add apps/backend directory to path for imports. pytest.ini's pythonpath
+# normally does this already; test modules rely on this one place.
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
 
 
 # =============================================================================
@@ -161,39 +167,45 @@ def pytest_runtest_setup(item):
 # =============================================================================
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory that's cleaned up after the test."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+def temp_dir(tmp_path: Path) -> Path:
+    """
+    Create a temporary directory for the test.
 
+    Backed by pytest's tmp_path, so --basetemp can place it on a tmpfs mount
+    and pytest prunes old runs instead of an rmtree after every test.
+    """
+    return tmp_path
 
-@pytest.fixture
-def temp_git_repo(temp_dir: Path) -> Generator[Path, None, None]:
-    """Create a temporary git repository with initial commit."""
-    # Initialize git repo
-    subprocess.run(["git", "init"], cwd=temp_dir, capture_output=True, check=True)
+
+def _init_git_repo(repo_dir: Path) -> None:
+    """Initialize a git repository with an initial commit on 'main'."""
+    subprocess.run(["git", "init"], cwd=repo_dir, capture_output=True, check=True)
     subprocess.run(
         ["git", "config", "user.email", "test@example.com"],
-        cwd=temp_dir, capture_output=True
+        cwd=repo_dir, capture_output=True
     )
     subprocess.run(
         ["git", "config", "user.name", "Test User"],
-        cwd=temp_dir, capture_output=True
+        cwd=repo_dir, capture_output=True
     )
 
     # Create initial commit
-    test_file = temp_dir / "README.md"
+    test_file = repo_dir / "README.md"
     test_file.write_text("# Test Project\n")
-    subprocess.run(["git", "add", "."], cwd=temp_dir, capture_output=True)
+    subprocess.run(["git", "add", "."], cwd=repo_dir, capture_output=True)
     subprocess.run(
         ["git", "commit", "-m", "Initial commit"],
-        cwd=temp_dir, capture_output=True
+        cwd=repo_dir, capture_output=True
     )
 
     # Ensure branch is named 'main' (some git configs default to 'master')
-    subprocess.run(["git", "branch", "-M", "main"], cwd=temp_dir, capture_output=True)
+    subprocess.run(["git", "branch", "-M", "main"], cwd=repo_dir, capture_output=True)
+
 
+@pytest.fixture
+def temp_git_repo(temp_dir: Path) -> Generator[Path, None, None]:
+    """Create a temporary git repository with initial commit."""
+    _init_git_repo(temp_dir)
     yield temp_dir
 
 
@@ -205,6 +217,32 @@ def spec_dir(temp_dir: Path) -> Path:
     return spec_path
 
 
+# =============================================================================
+# SOURCE FIXTURES
+# =============================================================================
+
+@functools.cache
+def _parse_source(path: Path, mtime_ns: int) -> tuple[str, ast.Module]:
+    """Read and parse a source file; the mtime key invalidates stale entries."""
+    text = path.read_text(encoding="utf-8")
+    return text, ast.parse(text, filename=str(path))
+
+
+@pytest.fixture(scope="session")
+def backend_source_tree():
+    """
+    Return a loader for backend source files as (text, AST) pairs.
+
+    Paths are relative to apps/backend. Each file is read and parsed once per
+    test process and re-parsed only if it changes on disk.
+    """
+    def load(relative_path: str) -> tuple[str, ast.Module]:
+        path = BACKEND_DIR / relative_path
+        return _parse_source(path, os.stat(path).st_mtime_ns)
+
+    return load
+
+
 # =============================================================================
 # REVIEW FIXTURES - Import from review_fixtures.py
 # =============================================================================
@@ -222,28 +260,13 @@ from tests.review_fixtures import (  # noqa: E402, F401
 # PROJECT STRUCTURE FIXTURES
 # =============================================================================
 
-@pytest.fixture
-def python_project(temp_git_repo: Path) -> Path:
-    """Create a sample Python project structure."""
-    # Create pyproject.toml
-    pyproject = {
-        "project": {
-            "name": "test-project",
-            "version": "0.1.0",
-            "dependencies": [
-                "flask>=2.0",
-                "pytest>=7.0",
-                "sqlalchemy>=2.0",
-            ],
-        },
-        "tool": {
-            "pytest": {"testpaths": ["tests"]},
-            "ruff": {"line-length": 100},
-        },
-    }
+@pytest.fixture(scope="session")
+def _python_project_template(tmp_path_factory) -> Path:
+    """Build the sample Python project repo once; python_project copies it."""
+    repo_dir = tmp_path_factory.mktemp("python_project")
+    _init_git_repo(repo_dir)
 
-    import tomllib
-    # Write as TOML (we'll write manually since tomllib is read-only)
+    # Create pyproject.toml
     toml_content = """[project]
 name = "test-project"
 version = "0.1.0"
@@ -259,24 +282,34 @@ testpaths = ["tests"]
 [tool.ruff]
 line-length = 100
 """
-    (temp_git_repo / "pyproject.toml").write_text(toml_content)
+    (repo_dir / "pyproject.toml").write_text(toml_content)
 
     # Create Python files
-    (temp_git_repo / "app").mkdir()
-    (temp_git_repo / "app" / "__init__.py").write_text("# App module\n")
-    (temp_git_repo / "app" / "main.py").write_text("def main():\n    pass\n")
+    (repo_dir / "app").mkdir()
+    (repo_dir / "app" / "__init__.py").write_text("# App module\n")
+    (repo_dir / "app" / "main.py").write_text("def main():\n    pass\n")
 
     # Create .env file
-    (temp_git_repo / ".env").write_text("DATABASE_URL=postgresql://localhost/test\n")
+    (repo_dir / ".env").write_text("DATABASE_URL=postgresql://localhost/test\n")
 
     # Commit changes
-    subprocess.run(["git", "add", "."], cwd=temp_git_repo, capture_output=True)
+    subprocess.run(["git", "add", "."], cwd=repo_dir, capture_output=True)
     subprocess.run(
         ["git", "commit", "-m", "Add Python project structure"],
-        cwd=temp_git_repo, capture_output=True
+        cwd=repo_dir, capture_output=True
     )
 
-    return temp_git_repo
+    return repo_dir
+
+
+@pytest.fixture
+def python_project(_python_project_template: Path, temp_dir: Path) -> Path:
+    """Create a sample Python project structure.
+
+    A plain copy of the session template, so tests may freely modify it.
+    """
+    shutil.copytree(_python_project_template, temp_dir, dirs_exist_ok=True)
+    return temp_dir
 
 
 @pytest.fixture
@@ -1081,6 +1114,12 @@ def mock_ai_resolver():
     return AIResolver(ai_call_fn=mock_ai_call)
 
 
+@pytest.fixture(scope="session")
+def fixed_now() -> datetime:
+    """A frozen timestamp for snapshots whose start time is irrelevant to the test."""
+    return datetime(2024, 1, 1)
+
+
 @pytest.fixture
 def temp_project(temp_git_repo: Path):
     """
@@ -10,7 +10,6 @@ without importing the Claude SDK which is not available in the test environment.
 """
 
 import sys
-from pathlib import Path
 from typing import Any, Dict, List
 from unittest.mock import MagicMock
 
@@ -100,9 +99,6 @@ def setup_qa_report_mocks() -> None:
     mock_client.create_client = MagicMock()
     sys.modules['client'] = mock_client
 
-    # Add auto-claude path for imports
-    sys.path.insert(0, str(Path(__file__).parent.parent / "Apps" / "backend"))
-
 
 def cleanup_qa_report_mocks() -> None:
     """Restore original modules after testing."""
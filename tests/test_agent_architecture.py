@@ -21,8 +21,28 @@ from pathlib import Path
 
 import pytest
 
-# Add apps/backend directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+REPO_ROOT = Path(__file__).parent.parent
+BACKEND_DIR = REPO_ROOT / "apps" / "backend"
+
+
+def _imported_modules(tree: ast.Module) -> set[str]:
+    """Return every name an import anywhere in tree could bind a module to.
+
+    Each dotted component of an imported module counts, as does each name
+    pulled in by ``from ... import``, so ``import pkg.coordinator``,
+    ``from agents import coordinator`` and ``from . import coordinator`` are
+    all reported as "coordinator".
+    """
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                modules.update(alias.name.split("."))
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                modules.update(node.module.split("."))
+            modules.update(alias.name for alias in node.names)
+    return modules
 
 
 class TestNoExternalParallelism:
@@ -30,9 +50,7 @@ class TestNoExternalParallelism:
 
     def test_no_coordinator_module(self):
         """No external coordinator module should exist."""
-        coordinator_path = (
-            Path(__file__).parent.parent / "apps" / "backend" / "coordinator.py"
-        )
+        coordinator_path = BACKEND_DIR / "coordinator.py"
         assert not coordinator_path.exists(), (
             "coordinator.py should not exist. Parallel orchestration is handled "
             "internally by the agent using Claude Code's Task tool."
@@ -40,9 +58,7 @@ class TestNoExternalParallelism:
 
     def test_no_task_tool_module(self):
         """No task_tool wrapper module should exist."""
-        task_tool_path = (
-            Path(__file__).parent.parent / "apps" / "backend" / "task_tool.py"
-        )
+        task_tool_path = BACKEND_DIR / "task_tool.py"
         assert not task_tool_path.exists(), (
             "task_tool.py should not exist. The agent spawns subagents directly "
             "using Claude Code's built-in Task tool."
@@ -50,37 +66,34 @@ class TestNoExternalParallelism:
 
     def test_no_subtask_worker_config(self):
         """No external subtask worker agent config should exist."""
-        worker_config = (
-            Path(__file__).parent.parent / ".claude" / "agents" / "subtask-worker.md"
-        )
+        worker_config = REPO_ROOT / ".claude" / "agents" / "subtask-worker.md"
         assert not worker_config.exists(), (
             "subtask-worker.md should not exist. Subagents use Claude Code's "
             "built-in agent types, not custom configs."
         )
 
 
+@pytest.mark.structure
 class TestCLIInterface:
     """Verify CLI doesn't expose parallel orchestration options."""
 
-    def test_no_parallel_flag(self):
+    def test_no_parallel_flag(self, backend_source_tree):
         """CLI should not have --parallel argument."""
-        run_py_path = Path(__file__).parent.parent / "apps" / "backend" / "run.py"
-        content = run_py_path.read_text(encoding="utf-8")
+        _, tree = backend_source_tree("run.py")
 
         # Check that --parallel is not defined as an argument
-        assert '"--parallel"' not in content, (
-            "CLI should not have --parallel flag. The agent decides when to "
-            "use parallel execution via subagents."
+        has_parallel_literal = any(
+            isinstance(node, ast.Constant) and node.value == "--parallel"
+            for node in ast.walk(tree)
         )
-        assert "'--parallel'" not in content, (
+        assert not has_parallel_literal, (
             "CLI should not have --parallel flag. The agent decides when to "
             "use parallel execution via subagents."
         )
 
-    def test_no_parallel_examples_in_docs(self):
+    def test_no_parallel_examples_in_docs(self, backend_source_tree):
         """CLI documentation should not mention parallel mode."""
-        run_py_path = Path(__file__).parent.parent / "apps" / "backend" / "run.py"
-        content = run_py_path.read_text(encoding="utf-8")
+        content, _ = backend_source_tree("run.py")
 
         # The docstring should not have --parallel examples
         assert "--parallel" not in content[:2000], (
@@ -126,14 +139,13 @@ class TestAgentEntryPoint:
         )
 
 
+@pytest.mark.structure
 class TestAgentPrompt:
     """Verify the agent prompt documents subagent capability."""
 
     def test_mentions_subagents(self):
         """Agent prompt mentions subagent capability."""
-        coder_prompt_path = (
-            Path(__file__).parent.parent / "apps" / "backend" / "prompts" / "coder.md"
-        )
+        coder_prompt_path = BACKEND_DIR / "prompts" / "coder.md"
         content = coder_prompt_path.read_text(encoding="utf-8")
 
         assert "subagent" in content.lower(), (
@@ -142,9 +154,7 @@ class TestAgentPrompt:
 
     def test_mentions_parallel_capability(self):
         """Agent prompt mentions parallel/concurrent capability."""
-        coder_prompt_path = (
-            Path(__file__).parent.parent / "apps" / "backend" / "prompts" / "coder.md"
-        )
+        coder_prompt_path = BACKEND_DIR / "prompts" / "coder.md"
         content = coder_prompt_path.read_text(encoding="utf-8")
 
         has_task_tool = "task tool" in content.lower() or "Task tool" in content
@@ -168,49 +178,57 @@ class TestModuleIntegrity:
         except ImportError as e:
             pytest.fail(f"agent.py failed to import: {e}")
 
-    def test_run_module_valid_syntax(self):
+    @pytest.mark.structure
+    def test_run_module_valid_syntax(self, backend_source_tree):
         """Run module has valid Python syntax."""
-        run_py_path = Path(__file__).parent.parent / "apps" / "backend" / "run.py"
-        content = run_py_path.read_text(encoding="utf-8")
-
         try:
-            ast.parse(content)
+            backend_source_tree("run.py")
         except SyntaxError as e:
             pytest.fail(f"run.py has syntax error: {e}")
 
-    def test_no_coordinator_imports(self):
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "import coordinator",
+            "import pkg.coordinator",
+            "from coordinator import run",
+            "from agents.coordinator import run",
+            "from agents import coordinator",
+            "from . import coordinator",
+        ],
+    )
+    def test_imported_modules_finds_every_import_form(self, source):
+        """The import scan catches a module however it is imported."""
+        assert "coordinator" in _imported_modules(ast.parse(source))
+
+    @pytest.mark.structure
+    def test_no_coordinator_imports(self, backend_source_tree):
         """Core modules don't import coordinator."""
         for filename in ["run.py", "core/agent.py"]:
-            filepath = Path(__file__).parent.parent / "apps" / "backend" / filename
-            content = filepath.read_text(encoding="utf-8")
+            _, tree = backend_source_tree(filename)
 
-            assert "from coordinator import" not in content, (
-                f"{filename} should not import coordinator"
-            )
-            assert "import coordinator" not in content, (
+            assert "coordinator" not in _imported_modules(tree), (
                 f"{filename} should not import coordinator"
             )
 
-    def test_no_task_tool_imports(self):
+    @pytest.mark.structure
+    def test_no_task_tool_imports(self, backend_source_tree):
         """Core modules don't import task_tool."""
         for filename in ["run.py", "core/agent.py"]:
-            filepath = Path(__file__).parent.parent / "apps" / "backend" / filename
-            content = filepath.read_text(encoding="utf-8")
+            _, tree = backend_source_tree(filename)
 
-            assert "from task_tool import" not in content, (
-                f"{filename} should not import task_tool"
-            )
-            assert "import task_tool" not in content, (
+            assert "task_tool" not in _imported_modules(tree), (
                 f"{filename} should not import task_tool"
             )
 
 
+@pytest.mark.structure
 class TestProjectDocumentation:
     """Verify project documentation is accurate."""
 
     def test_no_parallel_cli_documented(self):
         """CLAUDE.md doesn't document --parallel flag."""
-        claude_md_path = Path(__file__).parent.parent / "CLAUDE.md"
+        claude_md_path = REPO_ROOT / "CLAUDE.md"
         content = claude_md_path.read_text(encoding="utf-8")
 
         assert "--parallel 2" not in content, (
@@ -219,7 +237,7 @@ class TestProjectDocumentation:
 
     def test_subagent_architecture_documented(self):
         """CLAUDE.md documents subagent-based architecture."""
-        claude_md_path = Path(__file__).parent.parent / "CLAUDE.md"
+        claude_md_path = REPO_ROOT / "CLAUDE.md"
         content = claude_md_path.read_text(encoding="utf-8")
 
         has_subagent = "subagent" in content.lower()
@@ -328,14 +346,13 @@ class TestElectronToolScoping:
             )
 
 
+@pytest.mark.structure
 class TestSubtaskTerminology:
     """Verify subtask terminology is used consistently."""
 
     def test_progress_uses_subtask_terminology(self):
         """Progress module uses subtask terminology."""
-        progress_path = (
-            Path(__file__).parent.parent / "apps" / "backend" / "core" / "progress.py"
-        )
+        progress_path = BACKEND_DIR / "core" / "progress.py"
         content = progress_path.read_text(encoding="utf-8")
 
         assert "subtask" in content.lower(), (
@@ -6,17 +6,8 @@ that provides granular control over what tools/servers are available
 during each execution phase.
 """
 
-import os
 import pytest
 
-# Set up path for imports
-import sys
-from pathlib import Path
-
-# Add backend to path
-backend_path = Path(__file__).parent.parent / "apps" / "backend"
-sys.path.insert(0, str(backend_path))
-
 
 class TestAgentConfigs:
     """Tests for AGENT_CONFIGS registry."""
@@ -144,21 +135,17 @@ class TestGetRequiredMcpServers:
         servers = get_required_mcp_servers("planner", linear_enabled=True)
         assert "linear" in servers
 
-    def test_browser_resolved_to_electron_for_electron_project(self):
+    def test_browser_resolved_to_electron_for_electron_project(self, monkeypatch):
         """Browser should resolve to 'electron' for Electron projects."""
         from agents.tools_pkg.models import get_required_mcp_servers
 
-        # Mock ELECTRON_MCP_ENABLED
-        os.environ["ELECTRON_MCP_ENABLED"] = "true"
-        try:
-            servers = get_required_mcp_servers(
-                "qa_reviewer", project_capabilities={"is_electron": True}
-            )
-            assert "electron" in servers
-            assert "browser" not in servers
-            assert "puppeteer" not in servers
-        finally:
-            os.environ.pop("ELECTRON_MCP_ENABLED", None)
+        monkeypatch.setenv("ELECTRON_MCP_ENABLED", "true")
+        servers = get_required_mcp_servers(
+            "qa_reviewer", project_capabilities={"is_electron": True}
+        )
+        assert "electron" in servers
+        assert "browser" not in servers
+        assert "puppeteer" not in servers
 
     def test_browser_resolved_to_puppeteer_for_web_frontend(self):
         """Browser should resolve to 'puppeteer' for web frontend projects when enabled."""
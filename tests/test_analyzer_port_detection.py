@@ -13,12 +13,8 @@ Tests the robust port detection across multiple sources:
 import tempfile
 import shutil
 from pathlib import Path
-import sys
 import json
 
-# Add parent directory to path to import analyzer
-sys.path.insert(0, str(Path(__file__).parent.parent / "Apps" / "backend"))
-
 from analyzer import ServiceAnalyzer
 
 
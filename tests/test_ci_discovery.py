@@ -16,10 +16,6 @@ from pathlib import Path
 
 import pytest
 
-# Add auto-claude to path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "Apps" / "backend"))
-
 from ci_discovery import (
     CIConfig,
     CIWorkflow,
@@ -9,11 +9,6 @@ Verifies that:
 """
 
 import json
-import sys
-from pathlib import Path
-
-# Add auto-claude directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "Apps" / "backend"))
 
 from critique import (
     generate_critique_prompt,
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Tests for Dependency Validator
+==============================
+
+Tests the core/dependency_validator.py module functionality including:
+- Platform gating of the pywin32 check (Windows + Python 3.12+ only)
+- Exit behavior when pywintypes cannot be imported
+- The installation instructions printed on exit
+- Keeping the validator's import footprint small
+"""
+
+import builtins
+import importlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import sys
+import types
+from pathlib import Path
+from unittest.mock import patch
+
+import core.dependency_validator
+import pytest
+from core.dependency_validator import (
+    _exit_with_pywin32_error,
+    validate_platform_dependencies,
+)
+
+# What a successful `import pywintypes` returns; the validator never touches it.
+_FAKE_PYWINTYPES = types.ModuleType("pywintypes")
+
+
+class _BlockPywintypes:
+    """Meta path finder that makes ``import pywintypes`` raise ImportError."""
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname == "pywintypes":
+            raise ImportError("No module named 'pywintypes'")
+        return None
+
+
+class _BrokenPywintypesLoader(importlib.abc.Loader):
+    """Loader for a pywintypes that is on disk but fails to load."""
+
+    def create_module(self, spec):
+        return None
+
+    def exec_module(self, module):
+        raise ImportError("DLL load failed while importing pywintypes")
+
+
+class _FindBrokenPywintypes:
+    """Meta path finder that locates pywintypes with a loader that fails."""
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname == "pywintypes":
+            return importlib.machinery.ModuleSpec(fullname, _BrokenPywintypesLoader())
+        return None
+
+
+@pytest.fixture
+def pywintypes_installed(monkeypatch):
+    """Make pywintypes importable by placing a stand-in in sys.modules."""
+    monkeypatch.setitem(sys.modules, "pywintypes", _FAKE_PYWINTYPES)
+
+
+@pytest.fixture
+def pywintypes_missing(monkeypatch):
+    """Make pywintypes unimportable, even on hosts where it is installed."""
+    monkeypatch.delitem(sys.modules, "pywintypes", raising=False)
+    monkeypatch.setattr(sys, "meta_path", [_BlockPywintypes(), *sys.meta_path])
+
+
+@pytest.fixture
+def pywintypes_broken(monkeypatch):
+    """Make pywintypes locatable but raise ImportError when it is loaded."""
+    monkeypatch.delitem(sys.modules, "pywintypes", raising=False)
+    monkeypatch.setattr(sys, "meta_path", [_FindBrokenPywintypes(), *sys.meta_path])
+
+
+# (platform, version_info, pywintypes importable, expect exit)
+PLATFORM_CASES = [
+    pytest.param("win32", (3, 12, 0), False, True, id="win-py312-missing"),
+    pytest.param("win32", (3, 13, 1), False, True, id="win-py313-missing"),
+    pytest.param("win32", (3, 12, 0), True, False, id="win-py312-installed"),
+    pytest.param("win32", (3, 11, 9), False, False, id="win-py311"),
+    pytest.param("win32", (3, 10, 0), False, False, id="win-py310"),
+    pytest.param("linux", (3, 12, 0), False, False, id="linux"),
+    pytest.param("darwin", (3, 12, 0), False, False, id="macos"),
+    pytest.param("cygwin", (3, 12, 0), False, False, id="cygwin"),
+]
+
+
+class TestValidatePlatformDependencies:
+    """Tests for validate_platform_dependencies()."""
+
+    @pytest.mark.parametrize(
+        "platform_name,version,has_pywin32,should_exit", PLATFORM_CASES
+    )
+    def test_pywin32_check(
+        self, request, platform_name, version, has_pywin32, should_exit
+    ):
+        """Only Windows on Python 3.12+ without pywin32 exits."""
+        request.getfixturevalue(
+            "pywintypes_installed" if has_pywin32 else "pywintypes_missing"
+        )
+
+        with (
+            patch.multiple("sys", platform=platform_name, version_info=version),
+            patch("core.dependency_validator._exit_with_pywin32_error") as mock_exit,
+        ):
+            validate_platform_dependencies()
+
+        assert mock_exit.called is should_exit
+
+    def test_exits_when_pywintypes_is_found_but_fails_to_load(self, pywintypes_broken):
+        """A pywintypes that can be located but not imported still exits."""
+        assert importlib.util.find_spec("pywintypes") is not None
+
+        with (
+            patch.multiple("sys", platform="win32", version_info=(3, 12, 0)),
+            patch("core.dependency_validator._exit_with_pywin32_error") as mock_exit,
+        ):
+            validate_platform_dependencies()
+
+        mock_exit.assert_called_once()
+
+
+class _TestExit(BaseException):
+    """Raised in place of SystemExit so a test sees exactly one exit call."""
+
+
+def _raise_test_exit(message):
+    raise _TestExit(message)
+
+
+@pytest.fixture
+def exit_stub():
+    """Make sys.exit raise _TestExit, stopping the SUT just like a real exit."""
+    with patch("sys.exit", side_effect=_raise_test_exit):
+        yield
+
+
+class TestExitWithPywin32Error:
+    """Tests for the pywin32 installation instructions."""
+
+    def test_exits_with_install_instructions(self, exit_stub):
+        """The exit message tells the user how to install pywin32."""
+        with pytest.raises(_TestExit) as exc_info:
+            _exit_with_pywin32_error()
+
+        message = str(exc_info.value)
+        assert "pywin32" in message
+        assert "pip install pywin32>=306" in message
+        assert "pip install -r requirements.txt" in message
+
+    def test_message_includes_venv_activate_path(self, exit_stub):
+        """The activation hint is derived from sys.prefix."""
+        with patch("sys.prefix", "/fake/venv"), pytest.raises(_TestExit) as exc_info:
+            _exit_with_pywin32_error()
+
+        expected = str(Path("/fake/venv") / "Scripts" / "activate")
+        assert expected in str(exc_info.value)
+
+    def test_message_includes_current_python(self, exit_stub):
+        """The interpreter path is included to help diagnose the wrong venv."""
+        with (
+            patch("sys.executable", "/fake/python.exe"),
+            pytest.raises(_TestExit) as exc_info,
+        ):
+            _exit_with_pywin32_error()
+
+        assert "Current Python: /fake/python.exe" in str(exc_info.value)
+
+
+# Slow imports that belong to the memory/platform layers; the validator must
+# never load them.
+WATCHED_MODULES = frozenset(
+    {
+        "platform",
+        "graphiti_core",
+        "graphiti_config",
+        "graphiti_providers",
+        "real_ladybug",
+        "kuzu",
+    }
+)
+
+
+class TestImportFootprint:
+    """The validator runs at every entry point, so it must stay cheap to import."""
+
+    def test_validate_platform_dependencies_does_not_import_heavy_modules(
+        self, monkeypatch, pywintypes_installed
+    ):
+        """Neither importing nor running the validator pulls in platform/graphiti."""
+        imported_modules = set()
+        original_import = builtins.__import__
+
+        def tracking_import(name, *args, **kwargs):
+            top_level = name.partition(".")[0]
+            if top_level in WATCHED_MODULES:
+                imported_modules.add(top_level)
+            return original_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", tracking_import)
+        module = importlib.reload(core.dependency_validator)
+        with patch.multiple("sys", platform="win32", version_info=(3, 12, 0)):
+            module.validate_platform_dependencies()
+
+        assert not imported_modules, f"Unexpected imports: {sorted(imported_modules)}"
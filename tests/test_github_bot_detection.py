@@ -6,19 +6,10 @@ Tests the BotDetector class to ensure it correctly prevents infinite loops.
 """
 
 import json
-import sys
 from datetime import datetime, timedelta
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-
-# Add the backend runners/github directory to path
-_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
-_github_dir = _backend_dir / "runners" / "github"
-if str(_github_dir) not in sys.path:
-    sys.path.insert(0, str(_github_dir))
-
 from bot_detection import BotDetectionState, BotDetector
 
 
@@ -42,6 +33,21 @@ def mock_bot_detector(temp_state_dir):
         return detector
 
 
+@pytest.fixture(scope="class")
+def shared_bot_detector(tmp_path_factory):
+    """Bot detector shared across a class whose tests only call pure helpers.
+
+    Tests using it must not record reviews or otherwise change its state.
+    """
+    state_dir = tmp_path_factory.mktemp("github")
+    with patch.object(BotDetector, "_get_bot_username", return_value="test-bot"):
+        return BotDetector(
+            state_dir=state_dir,
+            bot_token="fake-token",
+            review_own_prs=False,
+        )
+
+
 class TestBotDetectionState:
     """Test BotDetectionState data class."""
 
@@ -110,15 +116,15 @@ class TestBotDetectorInit:
 class TestBotDetection:
     """Test bot detection methods."""
 
-    def test_is_bot_pr(self, mock_bot_detector):
+    def test_is_bot_pr(self, shared_bot_detector):
         """Test detecting bot-authored PRs."""
         bot_pr = {"author": {"login": "test-bot"}}
         human_pr = {"author": {"login": "alice"}}
 
-        assert mock_bot_detector.is_bot_pr(bot_pr) is True
-        assert mock_bot_detector.is_bot_pr(human_pr) is False
+        assert shared_bot_detector.is_bot_pr(bot_pr) is True
+        assert shared_bot_detector.is_bot_pr(human_pr) is False
 
-    def test_is_bot_commit(self, mock_bot_detector):
+    def test_is_bot_commit(self, shared_bot_detector):
         """Test detecting bot-authored commits."""
         bot_commit = {"author": {"login": "test-bot"}}
         human_commit = {"author": {"login": "alice"}}
@@ -127,11 +133,11 @@ class TestBotDetection:
             "author": {"login": "alice"},
         }
 
-        assert mock_bot_detector.is_bot_commit(bot_commit) is True
-        assert mock_bot_detector.is_bot_commit(human_commit) is False
-        assert mock_bot_detector.is_bot_commit(bot_committer) is True
+        assert shared_bot_detector.is_bot_commit(bot_commit) is True
+        assert shared_bot_detector.is_bot_commit(human_commit) is False
+        assert shared_bot_detector.is_bot_commit(bot_committer) is True
 
-    def test_get_last_commit_sha(self, mock_bot_detector):
+    def test_get_last_commit_sha(self, shared_bot_detector):
         """Test extracting last commit SHA."""
         # GitHub API returns commits in chronological order (oldest first, newest last)
         # So commits[-1] is the LATEST commit
@@ -140,16 +146,16 @@ class TestBotDetection:
             {"oid": "def456"},  # Latest commit
         ]
 
-        sha = mock_bot_detector.get_last_commit_sha(commits)
+        sha = shared_bot_detector.get_last_commit_sha(commits)
         assert sha == "def456"  # Should return the LAST (latest) commit
 
         # Test with sha field instead of oid
         commits_with_sha = [{"sha": "xyz789"}]
-        sha = mock_bot_detector.get_last_commit_sha(commits_with_sha)
+        sha = shared_bot_detector.get_last_commit_sha(commits_with_sha)
         assert sha == "xyz789"
 
         # Empty commits
-        assert mock_bot_detector.get_last_commit_sha([]) is None
+        assert shared_bot_detector.get_last_commit_sha([]) is None
 
 
 class TestCoolingOff:
@@ -6,24 +6,12 @@ Tests the full PR review flow with mocked external dependencies.
 These tests validate the integration between components.
 """
 
-import asyncio
 import json
-import sys
 from datetime import datetime, timedelta
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
-from dataclasses import dataclass
+from unittest.mock import patch
 
 import pytest
 
-# Add the backend directory to path
-_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
-_github_dir = _backend_dir / "runners" / "github"
-if str(_github_dir) not in sys.path:
-    sys.path.insert(0, str(_github_dir))
-if str(_backend_dir) not in sys.path:
-    sys.path.insert(0, str(_backend_dir))
-
 from models import (
     PRReviewResult,
     PRReviewFinding,
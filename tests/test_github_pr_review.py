@@ -5,23 +5,12 @@ Tests for GitHub PR Review System
 Tests the PR review orchestrator and follow-up review functionality.
 """
 
-import json
-import sys
+import asyncio
 from datetime import datetime
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
-from dataclasses import asdict
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-# Add the backend directory to path
-_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
-_github_dir = _backend_dir / "runners" / "github"
-if str(_github_dir) not in sys.path:
-    sys.path.insert(0, str(_github_dir))
-if str(_backend_dir) not in sys.path:
-    sys.path.insert(0, str(_backend_dir))
-
 from models import (
     PRReviewResult,
     PRReviewFinding,
@@ -30,7 +19,9 @@ from models import (
     MergeVerdict,
     FollowupReviewContext,
 )
-from bot_detection import BotDetector, BotDetectionState
+from bot_detection import BotDetector
+from gh_client import GHClient, GHCommandError, GHCommandResult, _backoff_delay
+from rate_limiter import RateLimitExceeded
 
 
 # ============================================================================
@@ -642,5 +633,112 @@ class TestBlockerGeneration:
         assert len(blockers) == 0
 
 
+# ============================================================================
+# GH Client Tests
+# ============================================================================
+
+class TestGHClient:
+    """Test CI status fetching and retry delays in GHClient."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_checks_and_awaiting_workflows_concurrently(self, tmp_path):
+        """Test that both gh calls are in flight together and their counts merge."""
+        events = []
+
+        async def fake_get_pr_checks(pr_number):
+            events.append("checks started")
+            await asyncio.sleep(0)
+            events.append("checks done")
+            return {"checks": [], "passing": 2, "failing": 0, "pending": 1, "failed_checks": []}
+
+        async def fake_get_workflows_awaiting_approval(pr_number):
+            events.append("workflows started")
+            await asyncio.sleep(0)
+            events.append("workflows done")
+            return {"awaiting_approval": 1, "workflow_runs": [{"id": 7}], "can_approve": True}
+
+        client = GHClient(project_dir=tmp_path)
+        with patch.object(client, "get_pr_checks", fake_get_pr_checks), patch.object(
+            client, "get_workflows_awaiting_approval", fake_get_workflows_awaiting_approval
+        ):
+            result = await client.get_pr_checks_comprehensive(123)
+
+        assert events[:2] == ["checks started", "workflows started"]
+        assert result["passing"] == 2
+        assert result["pending"] == 2
+        assert result["awaiting_approval"] == 1
+        assert result["awaiting_workflow_runs"] == [{"id": 7}]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_waits_for_both_calls_then_raises(self, tmp_path):
+        """Test that a rate limit in one call re-raises after the other call finishes."""
+        finished = []
+
+        async def fake_get_pr_checks(pr_number):
+            raise RateLimitExceeded("GitHub API rate limit exceeded")
+
+        async def fake_get_workflows_awaiting_approval(pr_number):
+            await asyncio.sleep(0)
+            finished.append("workflows")
+            raise RateLimitExceeded("GitHub API rate limit exceeded")
+
+        client = GHClient(project_dir=tmp_path)
+        with patch.object(client, "get_pr_checks", fake_get_pr_checks), patch.object(
+            client, "get_workflows_awaiting_approval", fake_get_workflows_awaiting_approval
+        ):
+            with pytest.raises(RateLimitExceeded):
+                await client.get_pr_checks_comprehensive(123)
+
+        assert finished == ["workflows"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "stdout,expected", [("abc123\n", "abc123"), ("", None), ("\n", None)]
+    )
+    async def test_get_pr_head_sha_reads_head_ref_oid(self, tmp_path, stdout, expected):
+        """Test that the HEAD SHA comes from headRefOid and empty output means None."""
+        client = GHClient(project_dir=tmp_path, repo="owner/repo")
+        result = GHCommandResult(
+            stdout=stdout, stderr="", returncode=0, command=[], attempts=1, total_time=0.0
+        )
+        with patch.object(client, "run", AsyncMock(return_value=result)) as mock_run:
+            assert await client.get_pr_head_sha(42) == expected
+
+        mock_run.assert_awaited_once_with(
+            [
+                "pr", "view", "42", "--json", "headRefOid", "--jq", ".headRefOid",
+                "-R", "owner/repo",
+            ],
+            timeout=30.0,
+        )
+
+    @pytest.mark.parametrize("attempt,base", [(1, 1), (2, 2), (3, 4)])
+    def test_retry_backoff_adds_bounded_jitter(self, attempt, base):
+        """Test that retry delays double per attempt with at most 20% jitter."""
+        with patch("gh_client.random.uniform", return_value=0.0):
+            assert _backoff_delay(attempt) == base
+        with patch("gh_client.random.uniform", return_value=0.2):
+            assert _backoff_delay(attempt) == pytest.approx(base * 1.2)
+
+    @pytest.mark.asyncio
+    async def test_run_retries_with_doubling_delays_without_sleeping(self, tmp_path):
+        """Test that failed attempts back off 1s then 2s on a recorded, not real, clock."""
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        client = GHClient(project_dir=tmp_path, max_retries=3, enable_rate_limiting=False)
+        with patch(
+            "gh_client.asyncio.create_subprocess_exec", side_effect=OSError("gh missing")
+        ), patch("gh_client.asyncio.sleep", fake_sleep), patch(
+            "gh_client.random.uniform", return_value=0.0
+        ):
+            with pytest.raises(GHCommandError, match="gh missing"):
+                await client.run(["pr", "view"])
+
+        assert delays == [1, 2]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,165 @@
+"""
+Tests for the GitLab API client
+===============================
+
+Tests connection reuse, retries and redirect handling in GitLabClient.
+"""
+
+import http.client
+import importlib.util
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Load the module directly: importing the runners package pulls in the CLI
+module_path = (
+    Path(__file__).parent.parent
+    / "apps"
+    / "backend"
+    / "runners"
+    / "gitlab"
+    / "glab_client.py"
+)
+spec = importlib.util.spec_from_file_location("glab_client", module_path)
+glab_client = importlib.util.module_from_spec(spec)
+sys.modules["glab_client"] = glab_client
+spec.loader.exec_module(glab_client)
+
+GitLabClient = glab_client.GitLabClient
+GitLabConfig = glab_client.GitLabConfig
+
+
+def _response(status: int, body: bytes = b"{}", headers: dict | None = None):
+    """Build a fake http.client response."""
+    response = MagicMock()
+    response.status = status
+    response.headers = headers or {}
+    response.read.return_value = body
+    return response
+
+
+@pytest.fixture
+def client(tmp_path):
+    """GitLab client that never goes through a proxy."""
+    config = GitLabConfig(
+        token="glpat-test",
+        project="group/project",
+        instance_url="https://gitlab.example.com",
+    )
+    with patch.object(glab_client.urllib.request, "getproxies", return_value={}):
+        with GitLabClient(tmp_path, config) as gitlab:
+            yield gitlab
+
+
+class TestConnectionReuse:
+    """Tests for the pooled keep-alive connection."""
+
+    def test_get_reconnects_after_idle_drop(self, client):
+        """A GET on a connection the server closed is retried on a fresh one."""
+        stale = MagicMock()
+        stale.request.side_effect = http.client.RemoteDisconnected("closed")
+        fresh = MagicMock()
+        fresh.getresponse.return_value = _response(200, b'{"id": 1}')
+
+        with patch.object(
+            glab_client.http.client, "HTTPSConnection", side_effect=[stale, fresh]
+        ):
+            assert client.get_current_user() == {"id": 1}
+
+        stale.close.assert_called_once()
+        fresh.request.assert_called_once()
+
+    def test_post_is_not_retried(self, client):
+        """A write on a dropped connection raises instead of being sent twice."""
+        with patch.object(
+            client,
+            "_send_pooled",
+            side_effect=http.client.RemoteDisconnected("closed"),
+        ) as send_pooled:
+            with pytest.raises(http.client.RemoteDisconnected):
+                client.post_mr_note(1, "LGTM")
+
+        assert send_pooled.call_count == 1
+
+    def test_close_drops_connection(self, client):
+        """close() closes and forgets the pooled connection."""
+        conn = MagicMock()
+        conn.sock = None
+        client._connection = conn
+
+        client.close()
+
+        conn.close.assert_called_once()
+        assert client._connection is None
+
+
+class TestRedirects:
+    """Tests for 3xx handling."""
+
+    def test_get_redirect_falls_back_to_urllib(self, client):
+        """A redirected GET is followed through urllib."""
+        with (
+            patch.object(
+                client, "_send_pooled", return_value=(302, {}, b"")
+            ) as send_pooled,
+            patch.object(
+                client, "_send_urllib", return_value=(200, {}, b'{"iid": 7}')
+            ) as send_urllib,
+        ):
+            assert client.get_mr(7) == {"iid": 7}
+
+        send_pooled.assert_called_once()
+        send_urllib.assert_called_once()
+        assert send_urllib.call_args.args[1] == "GET"
+
+    def test_post_redirect_is_returned_as_is(self, client):
+        """A redirected POST is not re-sent to the new location."""
+        with (
+            patch.object(client, "_send_pooled", return_value=(302, {}, b"")),
+            patch.object(client, "_send_urllib") as send_urllib,
+        ):
+            status, _, _ = client._send(
+                "https://gitlab.example.com/api/v4/projects/1/notes",
+                "POST",
+                b"{}",
+                {},
+                30.0,
+            )
+
+        assert status == 302
+        send_urllib.assert_not_called()
+
+
+class TestRateLimiting:
+    """Tests for 429 handling in _fetch."""
+
+    def test_retries_after_retry_after_seconds(self, client):
+        """A 429 waits for Retry-After and then retries the request."""
+        with (
+            patch.object(
+                client,
+                "_send_pooled",
+                side_effect=[
+                    (429, {"Retry-After": "5"}, b"slow down"),
+                    (200, {}, b'{"iid": 3}'),
+                ],
+            ) as send_pooled,
+            patch.object(glab_client.time, "sleep") as sleep,
+        ):
+            assert client.get_mr(3) == {"iid": 3}
+
+        sleep.assert_called_once_with(5)
+        assert send_pooled.call_count == 2
+
+    def test_backs_off_exponentially_without_retry_after(self, client):
+        """Without Retry-After, waits grow 1s, 2s and the last 429 is raised."""
+        with (
+            patch.object(client, "_send_pooled", return_value=(429, {}, b"slow down")),
+            patch.object(glab_client.time, "sleep") as sleep,
+        ):
+            with pytest.raises(Exception, match="GitLab API error 429"):
+                client.get_mr(3)
+
+        assert [c.args[0] for c in sleep.call_args_list] == [1, 2]
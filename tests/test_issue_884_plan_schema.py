@@ -323,6 +323,7 @@ async def test_planner_session_does_not_trigger_post_session_processing_on_retry
     )
     monkeypatch.setattr("agents.coder.run_agent_session", fake_run_agent_session)
     monkeypatch.setattr("agents.coder.AUTO_CONTINUE_DELAY_SECONDS", 0)
+    monkeypatch.setattr("agents.coder.SESSION_DELAY_SECONDS", 0)
     monkeypatch.setattr("agents.coder.load_subtask_context", lambda *_a, **_k: {})
 
     await run_autonomous_agent(
@@ -415,6 +416,7 @@ async def test_worktree_planning_to_coding_sync_updates_source_phase_status(
     )
     monkeypatch.setattr("agents.coder.run_agent_session", fake_run_agent_session)
     monkeypatch.setattr("agents.coder.AUTO_CONTINUE_DELAY_SECONDS", 0)
+    monkeypatch.setattr("agents.coder.SESSION_DELAY_SECONDS", 0)
     monkeypatch.setattr("agents.coder.load_subtask_context", lambda *_a, **_k: {})
 
     await run_autonomous_agent(
@@ -16,15 +16,10 @@ Covers:
 - Error handling for unknown strategies
 """
 
-import sys
 from datetime import datetime
-from pathlib import Path
 
 import pytest
 
-# Add auto-claude directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "Apps" / "backend"))
-
 from merge import (
     ChangeType,
     SemanticChange,
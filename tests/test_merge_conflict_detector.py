@@ -14,14 +14,8 @@ Covers:
 - Human-readable conflict explanations
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 
-# Add auto-claude directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "Apps" / "backend"))
-
 from merge import (
     ChangeType,
     SemanticChange,
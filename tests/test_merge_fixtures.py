@@ -10,7 +10,6 @@ Contains:
 """
 
 import subprocess
-import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Callable
@@ -18,9 +17,6 @@ from unittest.mock import MagicMock
 
 import pytest
 
-# Add auto-claude directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "Apps" / "backend"))
-
 from merge import (
     SemanticAnalyzer,
     ConflictDetector,
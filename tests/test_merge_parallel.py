@@ -12,14 +12,8 @@ Covers:
 - Base content handling (optional for new files)
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 
-# Add auto-claude directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "Apps" / "backend"))
-
 from workspace import ParallelMergeTask, ParallelMergeResult
 from core.workspace import _run_parallel_merges
 
@@ -14,15 +14,10 @@ Covers:
 - TaskSnapshot serialization
 """
 
-import sys
 from datetime import datetime
-from pathlib import Path
 
 import pytest
 
-# Add auto-claude directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "Apps" / "backend"))
-
 from merge import (
     ChangeType,
     SemanticChange,
@@ -10,7 +10,6 @@ from pathlib import Path
 
 import sys
 backend_path = Path(__file__).parent.parent / "apps" / "backend"
-sys.path.insert(0, str(backend_path))
 
 # Import directly to avoid loading the full runners module with its dependencies
 import importlib.util
@@ -11,16 +11,10 @@ Tests the phase_event.py module including:
 """
 
 import json
-import sys
 from io import StringIO
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-
-# Add backend to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
-
 from core.phase_event import (
     PHASE_MARKER_PREFIX,
     ExecutionPhase,
@@ -47,29 +41,20 @@ class TestExecutionPhaseEnum:
         # planning, coding, qa_review, qa_fixing, complete, failed
         assert len(ExecutionPhase) == 6
 
-    def test_planning_phase_exists(self):
-        """PLANNING phase has correct value."""
-        assert ExecutionPhase.PLANNING.value == "planning"
-
-    def test_coding_phase_exists(self):
-        """CODING phase has correct value."""
-        assert ExecutionPhase.CODING.value == "coding"
-
-    def test_qa_review_phase_exists(self):
-        """QA_REVIEW phase has correct value."""
-        assert ExecutionPhase.QA_REVIEW.value == "qa_review"
-
-    def test_qa_fixing_phase_exists(self):
-        """QA_FIXING phase has correct value."""
-        assert ExecutionPhase.QA_FIXING.value == "qa_fixing"
-
-    def test_complete_phase_exists(self):
-        """COMPLETE phase has correct value."""
-        assert ExecutionPhase.COMPLETE.value == "complete"
-
-    def test_failed_phase_exists(self):
-        """FAILED phase has correct value."""
-        assert ExecutionPhase.FAILED.value == "failed"
+    @pytest.mark.parametrize(
+        "name,value",
+        [
+            ("PLANNING", "planning"),
+            ("CODING", "coding"),
+            ("QA_REVIEW", "qa_review"),
+            ("QA_FIXING", "qa_fixing"),
+            ("COMPLETE", "complete"),
+            ("FAILED", "failed"),
+        ],
+    )
+    def test_phase_value(self, name, value):
+        """Each phase has its expected string value."""
+        assert ExecutionPhase[name].value == value
 
     def test_phase_is_string_subclass(self):
         """ExecutionPhase inherits from str for easy serialization."""
@@ -13,8 +13,12 @@ Tests the project_analyzer.py module functionality including:
 """
 
 import json
+import os
+import tomllib
 from pathlib import Path
+from unittest.mock import patch
 
+from project.config_parser import ConfigParser
 from project_analyzer import (
     BASE_COMMANDS,
     CustomScripts,
@@ -127,6 +131,48 @@ class TestLanguageDetection:
         assert "javascript" in analyzer.profile.detected_stack.languages
 
 
+class TestSuffixPatternScan:
+    """Tests that cached "*.ext" probes agree with Path.glob."""
+
+    def test_suffix_patterns_match_glob(self, temp_dir: Path):
+        """Root and recursive suffix patterns give the same answers as globbing."""
+        (temp_dir / "setup.py").write_text("")
+        (temp_dir / "src" / "components").mkdir(parents=True)
+        (temp_dir / "src" / "components" / "App.tsx").write_text("")
+        (temp_dir / "lib.rs").mkdir()
+
+        parser = ConfigParser(temp_dir)
+        patterns = ["*.py", "**/*.py", "*.ts", "*.tsx", "**/*.tsx", "*.rs", "**/*.go"]
+        for pattern in patterns:
+            expected = bool(list(temp_dir.glob(pattern)))
+            assert parser.file_exists(pattern) is expected, pattern
+
+    def test_tree_is_scanned_once(self, temp_dir: Path):
+        """Repeated suffix probes reuse the first walk."""
+        (temp_dir / "pkg").mkdir()
+        (temp_dir / "pkg" / "main.go").write_text("package main")
+
+        parser = ConfigParser(temp_dir)
+        with patch.object(parser, "_scan_tree", wraps=parser._scan_tree) as scan:
+            assert not parser.file_exists("*.py", "**/*.py")
+            assert parser.file_exists("**/*.go")
+
+        scan.assert_called_once()
+
+    def test_walk_stops_at_first_match(self, temp_dir: Path):
+        """A suffix found at the root does not walk the subdirectories."""
+        (temp_dir / "main.go").write_text("package main")
+        (temp_dir / "vendor" / "deep").mkdir(parents=True)
+
+        parser = ConfigParser(temp_dir)
+        with patch(
+            "project.config_parser.os.scandir", wraps=os.scandir
+        ) as mock_scandir:
+            assert parser.file_exists("**/*.go")
+
+        assert mock_scandir.call_count == 1
+
+
 class TestPackageManagerDetection:
     """Tests for package manager detection."""
 
@@ -347,6 +393,32 @@ class TestInfrastructureDetection:
 
         assert "helm" in analyzer.profile.detected_stack.infrastructure
 
+    def test_detects_kubernetes_outside_dependencies(self, temp_dir: Path):
+        """Manifests count in the project tree but not inside node_modules."""
+        manifest = "apiVersion: apps/v1\nkind: Deployment\n"
+        vendored = temp_dir / "node_modules" / "chart" / "deployment.yaml"
+        vendored.parent.mkdir(parents=True)
+        vendored.write_text(manifest)
+
+        analyzer = ProjectAnalyzer(temp_dir)
+        analyzer._detect_infrastructure()
+        assert "kubernetes" not in analyzer.profile.detected_stack.infrastructure
+
+        (temp_dir / "k8s").mkdir()
+        (temp_dir / "k8s" / "app.yml").write_text(manifest)
+        analyzer._detect_infrastructure()
+        assert "kubernetes" in analyzer.profile.detected_stack.infrastructure
+
+    def test_ignores_terraform_inside_dependencies(self, temp_dir: Path):
+        """Vendored .tf files don't make the project a Terraform project."""
+        vendored = temp_dir / ".venv" / "lib" / "main.tf"
+        vendored.parent.mkdir(parents=True)
+        vendored.write_text('resource "null_resource" "x" {}\n')
+
+        analyzer = ProjectAnalyzer(temp_dir)
+        analyzer._detect_infrastructure()
+        assert "terraform" not in analyzer.profile.detected_stack.infrastructure
+
 
 class TestCloudProviderDetection:
     """Tests for cloud provider detection."""
@@ -479,18 +551,78 @@ class TestSecurityProfileGeneration:
 
     def test_force_reanalyze(self, python_project: Path):
         """Force flag triggers re-analysis."""
-        profile1 = get_or_create_profile(python_project)
-        created1 = profile1.created_at
+        get_or_create_profile(python_project)
 
-        # Force re-analysis
-        import time
+        # Backdate the cached profile instead of sleeping for a new timestamp
+        profile_path = python_project / ".auto-claude-security.json"
+        data = json.loads(profile_path.read_text())
+        data["created_at"] = created1 = "2000-01-01T00:00:00"
+        profile_path.write_text(json.dumps(data))
+        assert get_or_create_profile(python_project).created_at == created1
 
-        time.sleep(0.1)  # Ensure different timestamp
+        # Force re-analysis
         profile2 = get_or_create_profile(python_project, force_reanalyze=True)
 
         # Should have different creation timestamp
         assert profile2.created_at != created1
 
+    def test_analyzer_version_bump_invalidates_cache(self, python_project: Path):
+        """A profile hashed by an older analyzer version is re-analyzed."""
+        profile = get_or_create_profile(python_project)
+        analyzer = ProjectAnalyzer(python_project)
+        assert not analyzer.should_reanalyze(profile)
+
+        with patch("project.analyzer.ANALYZER_VERSION", -1):
+            assert analyzer.should_reanalyze(profile)
+
+    def test_hash_tracks_nested_project_files(self, temp_dir: Path):
+        """Project files found anywhere in the tree feed the hash."""
+        (temp_dir / "src" / "App").mkdir(parents=True)
+        csproj = temp_dir / "src" / "App" / "App.csproj"
+        csproj.write_text("<Project />")
+        analyzer = ProjectAnalyzer(temp_dir)
+        before = analyzer.compute_project_hash()
+
+        csproj.write_text("<Project Sdk='Microsoft.NET.Sdk' />")
+
+        assert analyzer.compute_project_hash() != before
+
+    def test_hash_ignores_dependency_dirs(self, temp_dir: Path):
+        """Files under node_modules don't change the hash."""
+        (temp_dir / "index.js").write_text("")
+        analyzer = ProjectAnalyzer(temp_dir)
+        before = analyzer.compute_project_hash()
+
+        (temp_dir / "node_modules" / "left-pad").mkdir(parents=True)
+        (temp_dir / "node_modules" / "left-pad" / "index.js").write_text("")
+
+        assert analyzer.compute_project_hash() == before
+
+    def test_reanalysis_hashes_project_once(self, python_project: Path):
+        """The hash that detected a change is the one saved with the new profile."""
+        get_or_create_profile(python_project)
+        (python_project / "requirements.txt").write_text("django\n")
+
+        analyzer = ProjectAnalyzer(python_project)
+        with patch.object(
+            analyzer, "compute_project_hash", wraps=analyzer.compute_project_hash
+        ) as mock_hash:
+            profile = analyzer.analyze()
+
+        mock_hash.assert_called_once()
+        assert profile.project_hash == analyzer.compute_project_hash()
+        assert "django" in profile.detected_stack.frameworks
+
+    def test_analysis_parses_pyproject_once(self, python_project: Path):
+        """Stack, framework and structure detection share one parse."""
+        with patch(
+            "project.config_parser.tomllib.load", wraps=tomllib.load
+        ) as mock_load:
+            profile = ProjectAnalyzer(python_project).analyze(force=True)
+
+        mock_load.assert_called_once()
+        assert "flask" in profile.detected_stack.frameworks
+
 
 class TestCommandAllowlistChecking:
     """Tests for command allowlist checking."""
@@ -528,6 +660,15 @@ class TestCommandAllowlistChecking:
         allowed, reason = is_command_allowed("my-tool", profile)
         assert allowed is True
 
+    def test_script_command_added_later_is_allowed(self):
+        """Commands added to a profile's sets after creation are seen at once."""
+        profile = SecurityProfile()
+        assert is_command_allowed("make", profile)[0] is False
+
+        profile.script_commands.add("make")
+
+        assert is_command_allowed("make", profile) == (True, "")
+
 
 class TestValidatedCommands:
     """Tests for commands that need extra validation."""
@@ -15,10 +15,6 @@ import pytest
 import tempfile
 from pathlib import Path
 
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "Apps" / "backend"))
-
 from risk_classifier import (
     RiskClassifier,
     RiskAssessment,
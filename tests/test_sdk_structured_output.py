@@ -6,24 +6,8 @@ This test verifies how structured outputs work with the SDK.
 
 import asyncio
 import os
-import sys
-from pathlib import Path
 from pprint import pprint
 
-# Add backend to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
-
-# Add pydantic_models path
-_pydantic_models_path = (
-    Path(__file__).parent.parent
-    / "apps"
-    / "backend"
-    / "runners"
-    / "github"
-    / "services"
-)
-sys.path.insert(0, str(_pydantic_models_path))
-
 from pydantic import BaseModel, Field
 from typing import Literal
 
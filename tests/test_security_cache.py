@@ -1,11 +1,6 @@
 import pytest
 import json
-import time
-import sys
-from pathlib import Path
-
-# Ensure local apps/backend is in path
-sys.path.insert(0, str(Path(__file__).parents[1] / "apps" / "backend"))
+import os
 
 from security.profile import get_security_profile, reset_profile_cache
 from project.models import SecurityProfile
@@ -50,6 +45,14 @@ def create_valid_profile_json(commands, project_hash=""):
         "project_hash": project_hash
     })
 
+def rewrite_with_later_mtime(path, text):
+    """Rewrite path and move its mtime forward, instead of sleeping past
+    the filesystem's timestamp resolution (1s on some filesystems)."""
+    previous_ns = path.stat().st_mtime_ns
+    path.write_text(text)
+    later_ns = previous_ns + 2_000_000_000
+    os.utime(path, ns=(later_ns, later_ns))
+
 def get_dir_hash(project_dir):
     return ProjectAnalyzer(project_dir).compute_project_hash()
 
@@ -64,15 +67,13 @@ def test_cache_invalidation_on_file_creation(mock_project_dir, mock_profile_path
     profile1 = get_security_profile(mock_project_dir)
     assert "unique_cmd_A" not in profile1.get_all_allowed_commands()
 
-    # 2. Wait to ensure filesystem mtime has different second
-    # (some filesystems have 1-second resolution)
-    time.sleep(1.0)
-
-    # 3. Overwrite the file with our custom content
+    # 2. Overwrite the file with our custom content, with a newer mtime
     # Use the SAME hash we computed before (directory structure hasn't changed)
-    mock_profile_path.write_text(create_valid_profile_json(["unique_cmd_A"], current_hash))
+    rewrite_with_later_mtime(
+        mock_profile_path, create_valid_profile_json(["unique_cmd_A"], current_hash)
+    )
 
-    # 4. Second call - should detect file modification and reload
+    # 3. Second call - should detect file modification and reload
     profile2 = get_security_profile(mock_project_dir)
     assert "unique_cmd_A" in profile2.get_all_allowed_commands()
 
@@ -87,11 +88,10 @@ def test_cache_invalidation_on_file_modification(mock_project_dir, mock_profile_
     profile1 = get_security_profile(mock_project_dir)
     assert "unique_cmd_A" in profile1.get_all_allowed_commands()
 
-    # Wait to ensure mtime changes (some filesystems have 1-second resolution)
-    time.sleep(1.0)
-
-    # 3. Modify the file
-    mock_profile_path.write_text(create_valid_profile_json(["unique_cmd_B"], current_hash))
+    # 3. Modify the file, with a newer mtime
+    rewrite_with_later_mtime(
+        mock_profile_path, create_valid_profile_json(["unique_cmd_B"], current_hash)
+    )
 
     # 4. Call again - should detect modification
     profile2 = get_security_profile(mock_project_dir)
@@ -11,16 +11,13 @@ Tests cover:
 """
 
 import json
+import subprocess
 import tempfile
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 
-# Add auto-claude to path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "Apps" / "backend"))
-
 from security_scanner import (
     SecurityVulnerability,
     SecurityScanResult,
@@ -445,7 +442,9 @@ class TestSASTIntegration:
     @patch("subprocess.run")
     def test_bandit_output_parsing(self, mock_run, scanner, python_project):
         """Test parsing Bandit JSON output."""
-        mock_run.return_value = MagicMock(
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=["bandit"],
+            returncode=0,
             stdout=json.dumps({
                 "results": [
                     {
@@ -457,7 +456,7 @@ class TestSASTIntegration:
                     }
                 ]
             }),
-            returncode=0,
+            stderr="",
         )
 
         result = SecurityScanResult()
@@ -474,7 +473,9 @@ class TestSASTIntegration:
     @patch("subprocess.run")
     def test_npm_audit_output_parsing(self, mock_run, scanner, node_project):
         """Test parsing npm audit JSON output."""
-        mock_run.return_value = MagicMock(
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=["npm", "audit"],
+            returncode=0,
             stdout=json.dumps({
                 "vulnerabilities": {
                     "lodash": {
@@ -483,7 +484,7 @@ class TestSASTIntegration:
                     }
                 }
             }),
-            returncode=0,
+            stderr="",
         )
 
         result = SecurityScanResult()
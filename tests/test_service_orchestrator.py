@@ -12,13 +12,10 @@ Tests cover:
 import json
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-# Add auto-claude to path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "Apps" / "backend"))
-
 from service_orchestrator import (
     ServiceConfig,
     OrchestrationResult,
@@ -427,6 +424,48 @@ class TestServiceContext:
             assert hasattr(ctx, "success")
 
 
+# =============================================================================
+# HEALTH CHECKS
+# =============================================================================
+
+
+class TestWaitForHealth:
+    """Tests for waiting on service ports."""
+
+    def test_only_pending_ports_are_rechecked(self, temp_dir):
+        """Test that a port is not checked again once it is up."""
+        orchestrator = ServiceOrchestrator(temp_dir)
+        orchestrator._services = [
+            ServiceConfig(name="api", port=8000),
+            ServiceConfig(name="web", port=3000),
+            ServiceConfig(name="worker"),
+        ]
+        checked = []
+        up_after = {8000: 1, 3000: 3}
+
+        def fake_check_port(port):
+            checked.append(port)
+            return checked.count(port) >= up_after[port]
+
+        with (
+            patch.object(orchestrator, "_check_port", fake_check_port),
+            patch("services.orchestrator.time.sleep") as mock_sleep,
+        ):
+            assert orchestrator._wait_for_health(timeout=60) is True
+
+        assert checked.count(8000) == 1
+        assert checked.count(3000) == 3
+        assert mock_sleep.call_count == 2
+
+    def test_times_out_when_port_never_opens(self, temp_dir):
+        """Test that waiting stops at the timeout."""
+        orchestrator = ServiceOrchestrator(temp_dir)
+        orchestrator._services = [ServiceConfig(name="api", port=8000)]
+
+        with patch.object(orchestrator, "_check_port", return_value=False):
+            assert orchestrator._wait_for_health(timeout=0) is False
+
+
 # =============================================================================
 # EDGE CASES
 # =============================================================================
@@ -15,7 +15,7 @@ import json
 import pytest
 import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch, AsyncMock
+from unittest.mock import MagicMock
 
 # Store original modules for cleanup
 _original_modules = {}
@@ -49,8 +49,6 @@ sys.modules['claude_code_sdk.types'] = mock_code_types
 sys.modules['claude_agent_sdk'] = mock_agent_sdk
 sys.modules['claude_agent_sdk.types'] = mock_agent_types
 
-# Add auto-claude directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "Apps" / "backend"))
 
 from spec.complexity import (
     Complexity,
@@ -77,17 +75,17 @@ def cleanup_mocked_modules():
 class TestComplexityEnum:
     """Tests for Complexity enum values."""
 
-    def test_complexity_simple_value(self):
-        """SIMPLE enum has correct value."""
-        assert Complexity.SIMPLE.value == "simple"
-
-    def test_complexity_standard_value(self):
-        """STANDARD enum has correct value."""
-        assert Complexity.STANDARD.value == "standard"
-
-    def test_complexity_complex_value(self):
-        """COMPLEX enum has correct value."""
-        assert Complexity.COMPLEX.value == "complex"
+    @pytest.mark.parametrize(
+        "name,value",
+        [
+            ("SIMPLE", "simple"),
+            ("STANDARD", "standard"),
+            ("COMPLEX", "complex"),
+        ],
+    )
+    def test_complexity_value(self, name, value):
+        """Each complexity level has its expected string value."""
+        assert Complexity[name].value == value
 
     def test_complexity_from_string(self):
         """Can create Complexity from string value."""
@@ -604,36 +602,28 @@ class TestSaveAssessment:
 class TestRunAIComplexityAssessment:
     """Tests for run_ai_complexity_assessment() async function."""
 
+    @pytest.mark.parametrize(
+        "success,output",
+        [
+            pytest.param(False, "Agent failed", id="agent-failure"),
+            pytest.param(True, "Success but no file", id="missing-file"),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_returns_none_on_agent_failure(self, spec_dir: Path):
-        """Returns None when agent fails."""
-        async def mock_agent(prompt_file, additional_context=None):
-            return (False, "Agent failed")
-
+    async def test_returns_none_without_assessment(
+        self, spec_dir: Path, mock_run_agent_fn, success, output
+    ):
+        """Returns None when the agent fails or creates no assessment file."""
         result = await run_ai_complexity_assessment(
             spec_dir=spec_dir,
             task_description="test task",
-            run_agent_fn=mock_agent,
+            run_agent_fn=mock_run_agent_fn(success=success, output=output),
         )
 
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_returns_none_on_missing_file(self, spec_dir: Path):
-        """Returns None when assessment file not created."""
-        async def mock_agent(prompt_file, additional_context=None):
-            return (True, "Success but no file")
-
-        result = await run_ai_complexity_assessment(
-            spec_dir=spec_dir,
-            task_description="test task",
-            run_agent_fn=mock_agent,
-        )
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_parses_ai_assessment(self, spec_dir: Path):
+    async def test_parses_ai_assessment(self, spec_dir: Path, mock_run_agent_fn):
         """Parses AI assessment file correctly."""
         # Pre-create the assessment file that the agent would create
         assessment_data = {
@@ -660,13 +650,10 @@ class TestRunAIComplexityAssessment:
         }
         (spec_dir / "complexity_assessment.json").write_text(json.dumps(assessment_data))
 
-        async def mock_agent(prompt_file, additional_context=None):
-            return (True, "Assessment created")
-
         result = await run_ai_complexity_assessment(
             spec_dir=spec_dir,
             task_description="test task",
-            run_agent_fn=mock_agent,
+            run_agent_fn=mock_run_agent_fn(success=True, output="Assessment created"),
         )
 
         assert result is not None
@@ -6,24 +6,11 @@ Tests the Pydantic models used for Claude Agent SDK structured outputs
 in GitHub PR reviews.
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 from pydantic import ValidationError
 
 # Direct import of pydantic_models to avoid runners package chain
-# Path is set up by conftest.py
-_pydantic_models_path = (
-    Path(__file__).parent.parent
-    / "apps"
-    / "backend"
-    / "runners"
-    / "github"
-    / "services"
-)
-sys.path.insert(0, str(_pydantic_models_path))
-
+# Path is set up by pytest.ini
 from pydantic_models import (
     # Follow-up review models
     FindingResolution,
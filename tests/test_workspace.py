@@ -32,33 +32,33 @@ TEST_SPEC_NAME = "test-spec"
 class TestWorkspaceMode:
     """Tests for WorkspaceMode enum."""
 
-    def test_isolated_mode(self):
-        """ISOLATED mode value is correct."""
-        assert WorkspaceMode.ISOLATED.value == "isolated"
-
-    def test_direct_mode(self):
-        """DIRECT mode value is correct."""
-        assert WorkspaceMode.DIRECT.value == "direct"
+    @pytest.mark.parametrize(
+        "name,value",
+        [
+            ("ISOLATED", "isolated"),
+            ("DIRECT", "direct"),
+        ],
+    )
+    def test_mode_value(self, name, value):
+        """Each mode has its expected string value."""
+        assert WorkspaceMode[name].value == value
 
 
 class TestWorkspaceChoice:
     """Tests for WorkspaceChoice enum."""
 
-    def test_merge_choice(self):
-        """MERGE choice value is correct."""
-        assert WorkspaceChoice.MERGE.value == "merge"
-
-    def test_review_choice(self):
-        """REVIEW choice value is correct."""
-        assert WorkspaceChoice.REVIEW.value == "review"
-
-    def test_test_choice(self):
-        """TEST choice value is correct."""
-        assert WorkspaceChoice.TEST.value == "test"
-
-    def test_later_choice(self):
-        """LATER choice value is correct."""
-        assert WorkspaceChoice.LATER.value == "later"
+    @pytest.mark.parametrize(
+        "name,value",
+        [
+            ("MERGE", "merge"),
+            ("REVIEW", "review"),
+            ("TEST", "test"),
+            ("LATER", "later"),
+        ],
+    )
+    def test_choice_value(self, name, value):
+        """Each choice has its expected string value."""
+        assert WorkspaceChoice[name].value == value
 
 
 class TestHasUncommittedChanges: